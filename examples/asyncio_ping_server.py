@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio_ping_server.py
+~~~~~~~~~~~~~~~~~~~~~~
+
+TCP server based on asyncio simulating ping output.
+
+Asyncio-native alternative to threaded_ping_server: all simulated servers
+and their client handlers run as coroutines on the caller's event loop,
+so serving N clients costs no thread-per-connection context switches.
+"""
+
+__author__ = 'Grzegorz Latuszek'
+__copyright__ = 'Copyright (C) 2018, Nokia'
+__email__ = 'grzegorz.latuszek@nokia.com'
+
+import asyncio
+import functools
+import logging
+import sys
+
+from threaded_ping_server import ping_output
+
+
+async def handle_ping_client(reader, writer, server_port, ping_ip):
+    """Serve canned ping output to single connected client"""
+    client_host, client_port = writer.get_extra_info('peername')[:2]
+    logger = logging.getLogger('asyncio.ping.tcp-server({} -> {})'.format(server_port,
+                                                                          client_port))
+    logger.debug('connection accepted - client at tcp://{}:{}'.format(client_host,
+                                                                      client_port))
+    ping_out = ping_output.replace("10.0.2.15", ping_ip)
+    ping_lines = ping_out.splitlines(True)
+    try:
+        for ping_line in ping_lines:
+            writer.write(ping_line.encode(encoding='utf-8'))
+            await writer.drain()
+            await asyncio.sleep(1)  # simulate delay between ping lines
+    except ConnectionError:  # client is gone
+        pass
+    finally:
+        writer.close()
+    logger.info('Connection closed')
+
+
+async def start_ping_sim_server(server_address, ping_ip):
+    """Run server simulating ping command output, this is one-shot server"""
+    host, server_port = server_address
+    logger = logging.getLogger('asyncio.ping.tcp-server({})'.format(server_port))
+    client_handler = functools.partial(handle_ping_client,
+                                       server_port=server_port, ping_ip=ping_ip)
+    server = await asyncio.start_server(client_handler, host=host, port=server_port)
+    logger.debug("Ping Sim started at tcp://{}:{}".format(*server_address))
+    return server
+
+
+async def start_ping_servers(servers_addr):
+    servers = []
+    for address, ping_ip in servers_addr:
+        # simulate pinging given IP
+        server = await start_ping_sim_server(address, ping_ip)
+        servers.append(server)
+    return servers
+
+
+async def stop_ping_servers(servers):
+    for server in servers:
+        server.close()
+        await server.wait_closed()
+    logging.getLogger('asyncio.ping.tcp-server').debug("Ping Sim: ... bye")
+
+
+# ==============================================================================
+if __name__ == '__main__':
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s |%(name)-40s |%(message)s',
+        datefmt='%H:%M:%S',
+        stream=sys.stderr,
+    )
+
+    async def demo():
+        connections2serve = [(('localhost', 5671), '10.0.2.15'),
+                             (('localhost', 5672), '10.0.2.16')]
+        servers = await start_ping_servers(connections2serve)
+        await asyncio.sleep(2)
+        await stop_ping_servers(servers)
+
+    asyncio.get_event_loop().run_until_complete(demo())
@@ -11,9 +11,15 @@ __copyright__ = 'Copyright (C) 2018, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
 import logging
+import selectors
 import sys
 import asyncio
 
+try:
+    import uvloop  # libuv-based drop-in event loop, noticeably faster for TCP workloads
+except ImportError:
+    uvloop = None
+
 
 def configure_logging():
     logging.basicConfig(
@@ -46,7 +52,13 @@ def _cleanup_remaining_tasks(loop, logger):
 def run_via_asyncio(async_to_run, debug_event_loop=False):
     logger = logging.getLogger('asyncio.main')
 
-    asyncio.set_event_loop(asyncio.new_event_loop())
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.set_event_loop(asyncio.new_event_loop())
+    else:
+        # be explicit about the selector: DefaultSelector resolves to the best
+        # poll mechanism of this platform (epoll on Linux, kqueue on BSD/macOS)
+        asyncio.set_event_loop(asyncio.SelectorEventLoop(selectors.DefaultSelector()))
     event_loop = asyncio.get_event_loop()
     event_loop.set_debug(enabled=debug_event_loop)
     try:
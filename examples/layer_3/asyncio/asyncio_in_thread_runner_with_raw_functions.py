@@ -41,21 +41,27 @@ from moler.connection_factory import get_connection
 from moler.exceptions import ConnectionObserverTimeout
 from moler.runner_factory import get_runner
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))  # allow finding modules in examples/
+_examples_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _examples_dir not in sys.path:  # allow finding modules in examples/
+    sys.path.insert(0, _examples_dir)
 
 from network_toggle_observers import NetworkDownDetector, NetworkUpDetector
 
 
 # ===================== Moler's connection-observer usage ======================
 
+logger = logging.getLogger('moler.user.app-code')  # resolve once, not per task
+main_logger = logging.getLogger('asyncio.main')
+
 
 def ping_observing_task(ext_io_connection, ping_ip):
     """
     Here external-IO connection is abstract - we don't know its type.
     What we know is just that it has .moler_connection attribute.
     """
-    logger = logging.getLogger('moler.user.app-code')
     conn_addr = str(ext_io_connection)
+    strftime = time.strftime  # bind to locals; skips module attribute lookup per event
+    localtime = time.localtime
 
     # Layer 2 of Moler's usage (ext_io_connection + runner):
     # 3. create observers on Moler's connection
@@ -66,8 +72,7 @@ def ping_observing_task(ext_io_connection, ping_ip):
                                         connection=ext_io_connection.moler_connection,
                                         runner=get_runner(variant="asyncio-in-thread"))
 
-    info = '{} on {} using {}'.format(ping_ip, conn_addr, net_down_detector)
-    logger.debug('observe ' + info)
+    logger.debug('observe %s on %s using %s', ping_ip, conn_addr, net_down_detector)
 
     # 4. start observer (nonblocking, using as future)
     net_down_detector.start()  # should be started before we open connection
@@ -77,26 +82,26 @@ def ping_observing_task(ext_io_connection, ping_ip):
         # 5. await that observer to complete
         try:
             net_down_time = net_down_detector.await_done(timeout=10)  # =2 --> TimeoutError
-            timestamp = time.strftime("%H:%M:%S", time.localtime(net_down_time))
-            logger.debug('Network {} is down from {}'.format(ping_ip, timestamp))
+            if logger.isEnabledFor(logging.DEBUG):  # don't pay strftime cost if DEBUG is off
+                timestamp = strftime("%H:%M:%S", localtime(net_down_time))
+                logger.debug('Network {} is down from {}'.format(ping_ip, timestamp))
         except ConnectionObserverTimeout:
             logger.debug('Network down detector timed out')
 
         # 6. call next observer (blocking till completes)
-        info = '{} on {} using {}'.format(ping_ip, conn_addr, net_up_detector)
-        logger.debug('observe ' + info)
+        logger.debug('observe %s on %s using %s', ping_ip, conn_addr, net_up_detector)
         # using as synchronous function (so we want verb to express action)
         detect_network_up = net_up_detector
         net_up_time = detect_network_up()  # if you want timeout - see code above
-        timestamp = time.strftime("%H:%M:%S", time.localtime(net_up_time))
-        logger.debug('Network {} is back "up" from {}'.format(ping_ip, timestamp))
+        if logger.isEnabledFor(logging.DEBUG):
+            timestamp = strftime("%H:%M:%S", localtime(net_up_time))
+            logger.debug('Network {} is back "up" from {}'.format(ping_ip, timestamp))
     logger.debug('exiting ping_observing_task({})'.format(ping_ip))
 
 
 # ==============================================================================
 def main(connections2observe4ip):
-    logger = logging.getLogger('asyncio.main')
-    logger.debug('starting jobs observing connections')
+    main_logger.debug('starting jobs observing connections')
     # Starting the clients
     jobs_on_connections = []
     for connection_name, ping_ip in connections2observe4ip:
@@ -117,7 +122,7 @@ def main(connections2observe4ip):
     # await observers job to be done
     for client_thread in jobs_on_connections:
         client_thread.join()
-    logger.debug('all jobs observing connections are done')
+    main_logger.debug('all jobs observing connections are done')
 
 
 # ==============================================================================
@@ -39,13 +39,18 @@ import asyncio
 from moler.connection_factory import get_connection
 from moler.runner_factory import get_runner
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))  # allow finding modules in examples/
+_examples_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _examples_dir not in sys.path:  # allow finding modules in examples/
+    sys.path.insert(0, _examples_dir)
 
 from network_toggle_observers import NetworkDownDetector, NetworkUpDetector
 
 
 # ===================== Moler's connection-observer usage ======================
 
+logger = logging.getLogger('moler.user.app-code')  # resolve once, not per task
+main_logger = logging.getLogger('asyncio.main')
+
 
 async def ping_observing_task(ext_io_connection, ping_ip):
     """
@@ -53,20 +58,21 @@ async def ping_observing_task(ext_io_connection, ping_ip):
     What we know is just that it has .moler_connection attribute.
     """
 
-    logger = logging.getLogger('moler.user.app-code')
     conn_addr = str(ext_io_connection)
+    strftime = time.strftime  # bind to locals; skips module attribute lookup per event
+    localtime = time.localtime
 
     # Layer 2 of Moler's usage (ext_io_connection + runner):
     # 3. create observers on Moler's connection
+    runner = get_runner(variant="asyncio")  # single runner is enough for both observers
     net_down_detector = NetworkDownDetector(ping_ip,
                                             connection=ext_io_connection.moler_connection,
-                                            runner=get_runner(variant="asyncio"))
+                                            runner=runner)
     net_up_detector = NetworkUpDetector(ping_ip,
                                         connection=ext_io_connection.moler_connection,
-                                        runner=get_runner(variant="asyncio"))
+                                        runner=runner)
 
-    info = '{} on {} using {}'.format(ping_ip, conn_addr, net_down_detector)
-    logger.debug('observe ' + info)
+    logger.debug('observe %s on %s using %s', ping_ip, conn_addr, net_down_detector)
 
     # 4. start observer (nonblocking, using as future)
     net_down_detector.start()  # should be started before we open connection
@@ -76,26 +82,26 @@ async def ping_observing_task(ext_io_connection, ping_ip):
         # 5. await that observer to complete
         try:
             net_down_time = await asyncio.wait_for(net_down_detector, timeout=10)  # =2 --> TimeoutError
-            timestamp = time.strftime("%H:%M:%S", time.localtime(net_down_time))
-            logger.debug('Network {} is down from {}'.format(ping_ip, timestamp))
+            if logger.isEnabledFor(logging.DEBUG):  # don't pay strftime cost if DEBUG is off
+                timestamp = strftime("%H:%M:%S", localtime(net_down_time))
+                logger.debug('Network {} is down from {}'.format(ping_ip, timestamp))
         except asyncio.TimeoutError:
             logger.debug('Network down detector timed out')
 
         # 6. call next observer (blocking till completes)
-        info = '{} on {} using {}'.format(ping_ip, conn_addr, net_up_detector)
-        logger.debug('observe ' + info)
+        logger.debug('observe %s on %s using %s', ping_ip, conn_addr, net_up_detector)
         # using as synchronous function (so we want verb to express action)
         detect_network_up = net_up_detector
         net_up_time = await detect_network_up  # if you want timeout - see code above
-        timestamp = time.strftime("%H:%M:%S", time.localtime(net_up_time))
-        logger.debug('Network {} is back "up" from {}'.format(ping_ip, timestamp))
+        if logger.isEnabledFor(logging.DEBUG):
+            timestamp = strftime("%H:%M:%S", localtime(net_up_time))
+            logger.debug('Network {} is back "up" from {}'.format(ping_ip, timestamp))
     logger.debug('exiting ping_observing_task({})'.format(ping_ip))
 
 
 # ==============================================================================
 async def main(connections2observe4ip):
-    logger = logging.getLogger('asyncio.main')
-    logger.debug('starting jobs observing connections')
+    main_logger.debug('starting jobs observing connections')
     # Starting the clients
     jobs_on_connections = []
     for _, connection_name, ping_ip in connections2observe4ip:
@@ -109,16 +115,26 @@ async def main(connections2observe4ip):
         con_logger = logging.getLogger('tcp-async-io.{}'.format(connection_name))
         tcp_connection = get_connection(name=connection_name, variant='asyncio', logger=con_logger)
 
-        # client_task= asyncio.ensure_future(ping_observing_task(tcp_connection, ping_ip))
-        jobs_on_connections.append(ping_observing_task(tcp_connection, ping_ip))
+        client_task = asyncio.ensure_future(ping_observing_task(tcp_connection, ping_ip))
+        jobs_on_connections.append(client_task)
     # await observers job to be done
-    completed, pending = await asyncio.wait(jobs_on_connections)
-    logger.debug('all jobs observing connections are done')
+    await asyncio.gather(*jobs_on_connections)
+    main_logger.debug('all jobs observing connections are done')
+
+
+# ==============================================================================
+async def main_with_ping_servers(connections2observe4ip, connections2serve):
+    """Run ping-simulating servers on same loop as observers - no server threads"""
+    from asyncio_ping_server import start_ping_servers, stop_ping_servers
+    servers = await start_ping_servers(connections2serve)
+    try:
+        await main(connections2observe4ip)
+    finally:
+        await stop_ping_servers(servers)
 
 
 # ==============================================================================
 if __name__ == '__main__':
-    from threaded_ping_server import start_ping_servers, stop_ping_servers
     from asyncio_common import run_via_asyncio, configure_logging
     import os
     from moler.config import load_config
@@ -137,13 +153,7 @@ if __name__ == '__main__':
                          (('localhost', 5672), '10.0.2.16')]
     connections2observe4ip = [(('localhost', 5671), 'net_1', '10.0.2.15'),
                               (('localhost', 5672), 'net_2', '10.0.2.16')]
-    servers = start_ping_servers(connections2serve)
-
-    try:
-        run_via_asyncio(main(connections2observe4ip))
-
-    finally:
-        stop_ping_servers(servers)
+    run_via_asyncio(main_with_ping_servers(connections2observe4ip, connections2serve))
 
 '''
 LOG OUTPUT
@@ -53,6 +53,39 @@ class NetworkDownDetector(NetworkToggleDetector):
                                                   runner=runner)
 
 
+class NetworkDownThenUpDetector(ConnectionObserver):
+    """
+    One-pass variant fusing NetworkDownDetector + NetworkUpDetector.
+
+    Instead of running two observers in sequence (each subscribing to the
+    connection and scanning every line on its own), this single observer
+    drives a small down->up state machine, so each incoming line is
+    dispatched and matched just once. Result is a dict with 'down_time'
+    and 'up_time'.
+    """
+    def __init__(self, net_ip, connection=None, runner=None):
+        super(NetworkDownThenUpDetector, self).__init__(connection=connection,
+                                                        runner=runner)
+        self.net_ip = net_ip
+        self.down_pattern = "Network is unreachable"
+        self.up_pattern = "bytes from {}".format(net_ip)
+        self.down_time = None
+        self.logger = logging.getLogger('moler.{}'.format(self))
+
+    def data_received(self, data, recv_time):
+        """Awaiting ping output toggling down then back up"""
+        if not self.done():
+            if self.down_time is None:
+                if self.down_pattern in data:
+                    self.down_time = time.time()
+                    self.logger.debug("Network {} is down!".format(self.net_ip))
+            elif self.up_pattern in data:
+                when_detected = time.time()
+                self.logger.debug("Network {} is up!".format(self.net_ip))
+                self.set_result(result={'down_time': self.down_time,
+                                        'up_time': when_detected})
+
+
 class NetworkUpDetector(NetworkToggleDetector):
     """
     Awaiting change like:
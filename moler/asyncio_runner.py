@@ -12,13 +12,17 @@ import asyncio
 import asyncio.futures
 import asyncio.tasks
 import atexit
+import collections
 import concurrent.futures
+import contextvars
+import os
 import logging
 import threading
 import time
 import sys
 import psutil
 import functools
+import itertools
 import platform
 
 from moler.exceptions import MolerTimeout
@@ -40,28 +44,45 @@ else:
     (max_open_files_limit_soft, max_open_files_limit_hard) = (510, 512)  # TODO: any way on Win?
 
 
-def system_resources_usage():
-    if platform.system() == 'Linux':
-        curr_fds_open = current_process.num_fds()
-    else:
-        ofiles = current_process.open_files()
-        osockets = current_process.connections(kind="all")
-        curr_fds_open = len(ofiles) + len(osockets)  # TODO: any better way on Win?
-    curr_threads_nb = threading.active_count()
+_FD_WARN_THRESHOLD = max_open_files_limit_soft - 10  # precomputed; checked on every submit()
+
+# reading FDs count walks /proc/self/fd - too costly to repeat on every submit()
+_resources_usage_ttl = 0.25  # [sec] how long cached reading stays valid
+_resources_usage_cache = (0, 0)
+_resources_usage_read_time = 0.0
+
+
+def system_resources_usage(force_refresh=False):
+    global _resources_usage_cache, _resources_usage_read_time
+    now = time.monotonic()
+    curr_fds_open, curr_threads_nb = _resources_usage_cache
+    close_to_limit = curr_fds_open > max_open_files_limit_soft - 50
+    if force_refresh or close_to_limit or (now - _resources_usage_read_time > _resources_usage_ttl):
+        if platform.system() == 'Linux':
+            curr_fds_open = current_process.num_fds()
+        else:
+            ofiles = current_process.open_files()
+            osockets = current_process.connections(kind="all")
+            curr_fds_open = len(ofiles) + len(osockets)  # TODO: any better way on Win?
+        curr_threads_nb = threading.active_count()
+        _resources_usage_cache = (curr_fds_open, curr_threads_nb)
+        _resources_usage_read_time = now
     return curr_fds_open, curr_threads_nb
 
 
 def system_resources_usage_msg(curr_fds_open, curr_threads_nb):
-    msg = "RESOURCES USAGE: {}/{} FDs OPEN, {} threads active.".format(curr_fds_open, max_open_files_limit_soft,
-                                                                       curr_threads_nb)
+    msg = "RESOURCES USAGE: %s/%s FDs OPEN, %s threads active." % (curr_fds_open, max_open_files_limit_soft,
+                                                                   curr_threads_nb)
     return msg
 
 
 def check_system_resources_limit(connection_observer, observer_lock, logger):
     # The number of file descriptors currently opened by this process
-    curr_fds_open, curr_threads_nb = system_resources_usage()
+    curr_fds_open, _ = system_resources_usage()
 
-    if curr_fds_open > max_open_files_limit_soft - 10:
+    if curr_fds_open > _FD_WARN_THRESHOLD:
+        # active_count() walks the global threads list under lock - read it only on this error path
+        curr_threads_nb = threading.active_count()
         err_cause = "Can't run new asyncio loop - ALMOST REACHED MAX OPEN FILES LIMIT"
         msg = "{} ({}). Now {} FDs open, {} threads active.".format(err_cause, max_open_files_limit_soft,
                                                                     curr_fds_open, curr_threads_nb)
@@ -119,6 +140,9 @@ def thread_secure_get_event_loop(logger_name="moler.runner.asyncio"):
     :return: loop of current thread + info if it was newly created
     """
     new_loop = False
+    loop = asyncio._get_running_loop()  # C-level fast path, no exception flow
+    if loop is not None:
+        return loop, new_loop
     try:
         loop = asyncio.get_event_loop()
     except RuntimeError as err:
@@ -126,7 +150,7 @@ def thread_secure_get_event_loop(logger_name="moler.runner.asyncio"):
             loop = asyncio.new_event_loop()
             loop_id = instance_id(loop)
             logger = logging.getLogger(logger_name)
-            logger.debug("created new event loop {}:{}".format(loop_id, loop))
+            logger.debug("created new event loop %s:%s", loop_id, loop)
             asyncio.set_event_loop(loop)
             new_loop = True
         else:
@@ -142,10 +166,7 @@ def _run_until_complete_cb(fut):
         # Issue #22429: run_forever() already finished, no need to
         # stop it.
         return
-    fut_id = instance_id(fut)
-    msg = "_run_until_complete_cb(fut_id = {}, {})".format(fut_id, fut)
-    sys.stderr.write(msg + "\n")
-    logging.getLogger("moler").debug(msg)
+    logging.getLogger("moler").debug("_run_until_complete_cb(fut_id = %s, %s)", instance_id(fut), fut)
     fut._loop.stop()
 
 
@@ -162,44 +183,38 @@ def is_feeder(task):
 
 def handle_cancelled_feeder(connection_observer, observer_lock, subscribed_data_receiver, logger, future):
     if future.cancelled() and not connection_observer.done():
-        logger.debug("cancelled {}".format(future))
+        logger.debug("cancelled %s", future)
         with observer_lock:
-            logger.debug("cancelling {}".format(connection_observer))
+            logger.debug("cancelling %s", connection_observer)
             connection_observer.cancel()
-        logger.debug("unsubscribing {}".format(connection_observer))
-        moler_conn = connection_observer.connection
-        moler_conn.unsubscribe(observer=subscribed_data_receiver,
-                               connection_closed_handler=connection_observer.connection_closed_handler)
+        subscribed_data_receiver.unsubscribe_data_path()
 
 
 def cancel_remaining_feeders(loop, logger_name="moler.runner.asyncio", in_shutdown=False):
-    remaining = [task for task in asyncio.Task.all_tasks(loop=loop) if (not task.done()) and (is_feeder(task))]
+    remaining = [task for task in asyncio.all_tasks(loop=loop) if (not task.done()) and (is_feeder(task))]
     if remaining:
         logger = logging.getLogger(logger_name)
         loop_id = instance_id(loop)
         log_level = logging.WARNING if in_shutdown else logging.DEBUG
         logger.log(level=log_level, msg="cancelling all remaining feeders of loop {}:".format(loop_id))
-        remaining_tasks = asyncio.gather(*remaining, loop=loop, return_exceptions=True)
         for feeder in remaining:
             logger.log(level=log_level, msg="  remaining {}:{}".format(instance_id(feeder), feeder))
-        remaining_tasks.cancel()
+            feeder.cancel()
         if not loop.is_running():
             # Keep the event loop running until it is either destroyed or all tasks have really terminated
-            loop.run_until_complete(remaining_tasks)
+            loop.run_until_complete(asyncio.wait(remaining))
 
 
 class AsyncioRunner(ConnectionObserverRunner):
-    runner_lock = threading.Lock()
-    last_runner_id = 0
+    _id_generator = itertools.count(1)  # atomic under GIL, no lock needed for id handout
+    _lock_pool = collections.deque(maxlen=256)  # recycled observer locks; deque ops are atomic under GIL
 
     def __init__(self, logger_name='moler.runner.asyncio'):
         """Create instance of AsyncioRunner class"""
         self._in_shutdown = False
-        with AsyncioRunner.runner_lock:
-            AsyncioRunner.last_runner_id += 1
-            self._id = AsyncioRunner.last_runner_id  # instance_id(self)
+        self._id = next(AsyncioRunner._id_generator)  # instance_id(self)
         self.logger = logging.getLogger('{}.#{}'.format(logger_name, self._id))
-        self.logger.debug("created {}.#{}".format(self.__class__.__name__, self._id))
+        self.logger.debug("created %s.#%s", self.__class__.__name__, self._id)
         logging.getLogger("asyncio").setLevel(logging.DEBUG)
         self._submitted_futures = {}  # id(future): future
         self._started_ev_loops = []
@@ -210,28 +225,32 @@ class AsyncioRunner(ConnectionObserverRunner):
         self._in_shutdown = True  # will exit from feed()
         # TODO: need wait for all feed() coros before closing owned event loops
 
-        with AsyncioRunner.runner_lock:
-            owned_loops_nb = len(self._started_ev_loops)
-            if owned_loops_nb:
-                sys_resources_usage_msg = system_resources_usage_msg(*system_resources_usage())
-                self.logger.debug("before closing loops ({} owned loops): {}".format(owned_loops_nb,
-                                                                                     sys_resources_usage_msg))
-                for owned_loop in self._started_ev_loops:
-                    msg = "CLOSING EV_LOOP owned by AsyncioRunner {}:{!r}".format(instance_id(owned_loop), owned_loop)
-                    sys.stderr.write(msg + '\n')
-                    self.logger.debug(msg)
-                    cancel_remaining_feeders(owned_loop, logger_name=self.logger.name, in_shutdown=True)
-                    remaining = [task for task in asyncio.Task.all_tasks(loop=owned_loop) if not task.done()]
-                    if remaining:
-                        msg = "AsyncioRunner owned loop has still running task"
-                        for still_running_task in remaining:
-                            msg = "{}: {!r}\n".format(msg, still_running_task)
-                            sys.stderr.write(msg + '\n')
-                            self.logger.debug(msg)
-                    owned_loop.close()
-                self._started_ev_loops = []
-                sys_resources_usage_msg = system_resources_usage_msg(*system_resources_usage())
-                self.logger.debug("after closing loops: " + sys_resources_usage_msg)
+        # snapshot + reset are each atomic under GIL; no global runner lock needed
+        owned_loops = self._started_ev_loops
+        self._started_ev_loops = []
+        owned_loops_nb = len(owned_loops)
+        if owned_loops_nb:
+            sys_resources_usage_msg = system_resources_usage_msg(*system_resources_usage(force_refresh=True))
+            self.logger.debug("before closing loops (%s owned loops): %s", owned_loops_nb, sys_resources_usage_msg)
+            for owned_loop in owned_loops:
+                msg = "CLOSING EV_LOOP owned by AsyncioRunner {}:{!r}".format(instance_id(owned_loop), owned_loop)
+                sys.stderr.write(msg + '\n')
+                self.logger.debug(msg)
+                cancel_remaining_feeders(owned_loop, logger_name=self.logger.name, in_shutdown=True)
+                # our own futures are tracked in _submitted_futures; no need to scan
+                # the global weakset of all tasks per owned loop
+                remaining = [future for future in self._submitted_futures.values()
+                             if (future.get_loop() is owned_loop) and (not future.done())]
+                if remaining:
+                    msg = "AsyncioRunner owned loop has still running task"
+                    for still_running_task in remaining:
+                        still_running_task.cancel()  # don't leave 'pending task destroyed' noise
+                        msg = "{}: {!r}\n".format(msg, still_running_task)
+                        sys.stderr.write(msg + '\n')
+                        self.logger.debug(msg)
+                owned_loop.close()
+            sys_resources_usage_msg = system_resources_usage_msg(*system_resources_usage(force_refresh=True))
+            self.logger.debug("after closing loops: " + sys_resources_usage_msg)
 
         event_loop, its_new = thread_secure_get_event_loop(logger_name=self.logger.name)
         if not event_loop.is_closed():
@@ -243,7 +262,10 @@ class AsyncioRunner(ConnectionObserverRunner):
         Submit connection observer to background execution.
         Returns Future that could be used to await for connection_observer done.
         """
-        observer_lock = threading.Lock()  # against threads race write-access to observer
+        try:
+            observer_lock = AsyncioRunner._lock_pool.popleft()  # recycle lock of finished observer
+        except IndexError:
+            observer_lock = threading.Lock()  # against threads race write-access to observer
 
         impossible_future = check_system_resources_limit(connection_observer, observer_lock, self.logger)
         if impossible_future:
@@ -251,10 +273,10 @@ class AsyncioRunner(ConnectionObserverRunner):
 
         assert connection_observer.life_status.start_time > 0.0  # connection-observer lifetime should
         # already been started
-        observer_timeout = connection_observer.timeout
-        remain_time, msg = his_remaining_time("remaining", timeout=observer_timeout,
-                                              from_start_time=connection_observer.life_status.start_time)
-        self.logger.debug("go background: {!r} - {}".format(connection_observer, msg))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
+                                                  from_start_time=connection_observer.life_status.start_time)
+            self.logger.debug("go background: %r - %s", connection_observer, msg)
 
         # Our submit consists of two steps:
         # 1. _start_feeding() which establishes data path from connection to observer
@@ -278,25 +300,26 @@ class AsyncioRunner(ConnectionObserverRunner):
         # duration of submit() is measured as around 0.0007sec (depends on machine).
         event_loop, its_new = thread_secure_get_event_loop(logger_name=self.logger.name)
         if its_new:
-            with AsyncioRunner.runner_lock:
-                self._started_ev_loops.append(event_loop)
-        subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
-        self.logger.debug("scheduling feed({})".format(connection_observer))
-        connection_observer_future = asyncio.ensure_future(self.feed(connection_observer,
-                                                                     subscribed_data_receiver,
-                                                                     observer_lock),
-                                                           loop=event_loop)
-        self.logger.debug("runner submit() returning - future: {}:{}".format(instance_id(connection_observer_future),
-                                                                             connection_observer_future))
+            self._started_ev_loops.append(event_loop)  # list.append is atomic under GIL
+        progress_event = asyncio.Event()  # lets data-path wake feed() instead of feed() polling
+        subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock,
+                                                       progress_event=progress_event, loop=event_loop)
+        self.logger.debug("scheduling feed(%s)", connection_observer)
+        connection_observer_future = event_loop.create_task(self.feed(connection_observer,
+                                                                      subscribed_data_receiver,
+                                                                      observer_lock,
+                                                                      progress_event=progress_event))
+        self.logger.debug("runner submit() returning - future: %s:%s", instance_id(connection_observer_future),
+                          connection_observer_future)
         if connection_observer_future.done():
             # most probably we have some exception during ensure_future(); it should be stored inside future
             try:
                 too_early_result = connection_observer_future.result()
                 err_msg = "PROBLEM: future returned {} already in runner.submit()".format(too_early_result)
-                self.logger.warning("go background: {} - {}".format(connection_observer, err_msg))
+                self.logger.warning("go background: %s - %s", connection_observer, err_msg)
             except Exception as err:
                 err_msg = "PROBLEM: future raised {!r} during runner.submit()".format(err)
-                self.logger.warning("go background: {} - {}".format(connection_observer, err_msg))
+                self.logger.warning("go background: %s - %s", connection_observer, err_msg)
                 self.logger.exception(err_msg)
                 raise
 
@@ -334,7 +357,7 @@ class AsyncioRunner(ConnectionObserverRunner):
             #    wait_for() might be called so late after submit() that observer already got result/exception
             #
             # In all above cases we want to stop future if it is still running
-            self.logger.debug("go foreground: {} is already done".format(connection_observer))
+            self.logger.debug("go foreground: %s is already done", connection_observer)
             self._cancel_submitted_future(connection_observer, connection_observer_future)
             return None
 
@@ -343,12 +366,12 @@ class AsyncioRunner(ConnectionObserverRunner):
         # we count timeout from now if timeout is given; else we use .life_status.start_time and .timeout of observer
         start_time = time.time() if max_timeout else connection_observer.life_status.start_time
         await_timeout = max_timeout if max_timeout else observer_timeout
-        if max_timeout:
-            remain_time, msg = his_remaining_time("await max.", timeout=max_timeout, from_start_time=start_time)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            prefix = "await max." if max_timeout else "remaining"
+            remain_time, msg = his_remaining_time(prefix, timeout=await_timeout, from_start_time=start_time)
+            self.logger.debug("go foreground: %s - %s", connection_observer, msg)
         else:
-            remain_time, msg = his_remaining_time("remaining", timeout=observer_timeout, from_start_time=start_time)
-
-        self.logger.debug("go foreground: {} - {}".format(connection_observer, msg))
+            remain_time = max(await_timeout - (time.time() - start_time), 0.0)
         event_loop, its_new = thread_secure_get_event_loop()
         assert not its_new  # should not happen since submit() is called first
 
@@ -372,15 +395,23 @@ class AsyncioRunner(ConnectionObserverRunner):
                 self._run_via_asyncio(event_loop, connection_observer_future, max_timeout, remain_time)
 
             except asyncio.futures.CancelledError:
-                self.logger.debug("canceled {}".format(connection_observer))
+                self.logger.debug("canceled %s", connection_observer)
                 connection_observer.cancel()
             except asyncio.futures.TimeoutError:
                 self._wait_for_time_out(connection_observer, connection_observer_future,
                                         timeout=await_timeout)
             finally:
                 self._cancel_submitted_future(connection_observer, connection_observer_future)
+                self._recycle_observer_lock(connection_observer, connection_observer_future)
         return None
 
+    @staticmethod
+    def _recycle_observer_lock(connection_observer, connection_observer_future):
+        future = connection_observer_future or connection_observer._future
+        observer_lock = getattr(future, "observer_lock", None)
+        if (observer_lock is not None) and (not observer_lock.locked()):
+            AsyncioRunner._lock_pool.append(observer_lock)  # deque(maxlen) drops overflow itself
+
     def _cancel_submitted_future(self, connection_observer, connection_observer_future):
         future = connection_observer_future or connection_observer._future
         if future:
@@ -409,63 +440,58 @@ class AsyncioRunner(ConnectionObserverRunner):
             if max_timeout:
                 timeout_limited_future = asyncio.wait_for(connection_observer_future, timeout=remain_time)
 
-                fut_id = instance_id(connection_observer_future)
-                msg = "__run_via_asyncio with timeout: (fut_id = {}, {})".format(fut_id, connection_observer_future)
-                sys.stderr.write(msg + "\n")
-                logging.getLogger("moler").debug(msg)
-                fut_id = instance_id(timeout_limited_future)
-                msg = "__run_via_asyncio with timeout: (tmout_fut_id = {}, {})".format(fut_id, timeout_limited_future)
-                sys.stderr.write(msg + "\n")
-                logging.getLogger("moler").debug(msg)
+                logging.getLogger("moler").debug("__run_via_asyncio with timeout: (fut_id = %s, %s)",
+                                                 instance_id(connection_observer_future), connection_observer_future)
+                logging.getLogger("moler").debug("__run_via_asyncio with timeout: (tmout_fut_id = %s, %s)",
+                                                 instance_id(timeout_limited_future), timeout_limited_future)
 
-                AsyncioRunner._run_until_complete(event_loop, timeout_limited_future)
+                AsyncioRunner._run_until_complete_coro(event_loop, timeout_limited_future)
 
             else:
-                fut_id = instance_id(connection_observer_future)
-                msg = "__run_via_asyncio no timeout: (fut_id = {}, {})".format(fut_id, connection_observer_future)
-                sys.stderr.write(msg + "\n")
-                logging.getLogger("moler").debug(msg)
-                AsyncioRunner._run_until_complete(event_loop, connection_observer_future)  # timeout is handled by feed()
+                logging.getLogger("moler").debug("__run_via_asyncio no timeout: (fut_id = %s, %s)",
+                                                 instance_id(connection_observer_future), connection_observer_future)
+                # timeout is handled by feed()
+                AsyncioRunner._run_until_complete_task(event_loop, connection_observer_future)
 
         except BaseException as exc:
             fut = connection_observer_future
-            fut_id = instance_id(connection_observer_future)
-            err_msg = "_run_until_complete(max_tm={}, remain={}): raised {!r}\n\tfut: {}:{!r}".format(max_timeout,
-                                                                                                      remain_time,
-                                                                                                      exc,
-                                                                                                      fut_id, fut)
-            sys.stderr.write(err_msg + "\n")
-            logging.getLogger("moler").debug(msg)
+            logging.getLogger("moler").debug("_run_until_complete(max_tm=%s, remain=%s): raised %r\n\tfut: %s:%r",
+                                             max_timeout, remain_time, exc, instance_id(fut), fut)
             raise
 
     @staticmethod
-    def _run_until_complete(event_loop, future):
-        """Run until the Future is done.
+    def _run_until_complete_coro(event_loop, coro):
+        """Wrap coroutine in a Task and run until it is done.
 
-        If the argument is a coroutine, it is wrapped in a Task.
+        WARNING: It would be disastrous to call it with the same coroutine
+        twice -- it would wrap it in two different Tasks and that can't be good.
 
-        WARNING: It would be disastrous to call run_until_complete()
-        with the same coroutine twice -- it would wrap it in two
-        different Tasks and that can't be good.
-
-        Return the Future's result, or raise its exception.
+        Return the Task's result, or raise its exception.
         """
         event_loop._check_closed()
 
-        new_task = not asyncio.futures.isfuture(future)
-        fut_id = instance_id(future)
-        future = asyncio.tasks.ensure_future(future, loop=event_loop)
-        task_id = instance_id(future)
-        msg = "task for future id ({}) future = asyncio.tasks.ensure_future: (task_id = {}, {})".format(fut_id, task_id,
-                                                                                                        future)
-        sys.stderr.write(msg + "\n")
-        logging.getLogger("moler").debug(msg)
+        coro_id = instance_id(coro)
+        future = asyncio.tasks.ensure_future(coro, loop=event_loop)
+        logging.getLogger("moler").debug("task for future id (%s) future = asyncio.tasks.ensure_future: (task_id = %s, %s)",
+                                         coro_id, instance_id(future), future)
+        # An exception is raised if the future didn't complete, so there
+        # is no need to log the "destroy pending task" message
+        future._log_destroy_pending = False
+        return AsyncioRunner._loop_until_future_done(event_loop, future, new_task=True)
+
+    @staticmethod
+    def _run_until_complete_task(event_loop, future):
+        """Run until the already-scheduled Task is done.
 
-        if new_task:
-            # An exception is raised if the future didn't complete, so there
-            # is no need to log the "destroy pending task" message
-            future._log_destroy_pending = False
+        Skips the isfuture/ensure_future dispatch of the coroutine variant.
 
+        Return the Task's result, or raise its exception.
+        """
+        event_loop._check_closed()
+        return AsyncioRunner._loop_until_future_done(event_loop, future, new_task=False)
+
+    @staticmethod
+    def _loop_until_future_done(event_loop, future, new_task):
         future.add_done_callback(_run_until_complete_cb)
         try:
             event_loop.run_forever()
@@ -480,17 +506,16 @@ class AsyncioRunner(ConnectionObserverRunner):
             future.remove_done_callback(_run_until_complete_cb)
         if not future.done():
             fut_id = instance_id(future)
-            msg = "not done future in _run_until_complete(fut_id = {}, {})".format(fut_id, future)
-            sys.stderr.write(msg + "\n")
-            logging.getLogger("moler").debug(msg)
+            logging.getLogger("moler").debug("not done future in _run_until_complete(fut_id = %s, %s)", fut_id, future)
             raise RuntimeError('Event loop stopped before Future completed. (fut_id = {}, {})'.format(fut_id, future))
 
         return future.result()
 
     def _raise_wrong_usage_of_wait_for(self, connection_observer):
-        import inspect  # don't import if never raising this exception
-        (_, _, _, caller_name, _, _) = inspect.stack()[1]
-        (_, _, _, caller_caller_name, _, _) = inspect.stack()[2]
+        # sys._getframe() reads just the needed frames; inspect.stack() would walk
+        # the whole stack and load source lines for every frame
+        caller_name = sys._getframe(1).f_code.co_name
+        caller_caller_name = sys._getframe(2).f_code.co_name
         # Prefer to speak in observer API not runner API since user uses observers-API (runner is hidden)
         user_call_name = caller_caller_name if caller_caller_name == 'await_done' else caller_name
         err_msg = "Can't call {}() from 'async def' - it is blocking call".format(user_call_name)
@@ -515,7 +540,7 @@ class AsyncioRunner(ConnectionObserverRunner):
         :param connection_observer_future: Future of connection-observer returned from submit().
         :return: iterator
         """
-        self.logger.debug("go foreground: {!r}".format(connection_observer))
+        self.logger.debug("go foreground: %r", connection_observer)
 
         # assuming that connection_observer.start() / runner.submit(connection_observer)
         # has already scheduled future via asyncio.ensure_future
@@ -527,7 +552,7 @@ class AsyncioRunner(ConnectionObserverRunner):
         # Here we know, connection_observer_future is asyncio.Future (precisely asyncio.tasks.Task)
         # and we know it has __await__() method.
 
-    def _start_feeding(self, connection_observer, observer_lock):
+    def _start_feeding(self, connection_observer, observer_lock, progress_event=None, loop=None):
         """
         Start feeding connection_observer by establishing data-channel from connection to observer.
         """
@@ -541,69 +566,112 @@ class AsyncioRunner(ConnectionObserverRunner):
         #
         # main purpose of secure_data_received() is to progress observer-life by data
         #
+        # pre-bound observer methods: closure runs per inbound chunk, skip the LOAD_ATTRs there
+        observer_done = connection_observer.done
+        observer_data_received = connection_observer.data_received
+        observer_set_exception = connection_observer.set_exception
+
+        moler_conn = connection_observer.connection
+
         def secure_data_received(data, recv_time):
             try:
-                if connection_observer.done() or self._in_shutdown:
+                if observer_done() or self._in_shutdown:
                     return  # even not unsubscribed secure_data_received() won't pass data to done observer
                 with observer_lock:
-                    connection_observer.data_received(data, recv_time)
+                    observer_data_received(data, recv_time)
 
             except Exception as exc:  # TODO: handling stacktrace
                 # observers should not raise exceptions during data parsing
                 # but if they do so - we fix it
                 with observer_lock:
-                    connection_observer.set_exception(exc)
+                    observer_set_exception(exc)
             finally:
-                if connection_observer.done() and not connection_observer.cancelled():
-                    if connection_observer._exception:
-                        self.logger.debug("{} raised: {!r}".format(connection_observer, connection_observer._exception))
-                    else:
-                        self.logger.debug("{} returned: {}".format(connection_observer, connection_observer._result))
-
-        moler_conn = connection_observer.connection
-        self.logger.debug("subscribing for data {}".format(connection_observer))
+                if observer_done():
+                    if not connection_observer.cancelled():
+                        if connection_observer._exception:
+                            self.logger.debug("%s raised: %r", connection_observer, connection_observer._exception)
+                        else:
+                            self.logger.debug("%s returned: %s", connection_observer, connection_observer._result)
+                    # stop delivery right away - no point dispatching remaining stream to done observer
+                    unsubscribe_data_path()
+                    if progress_event is not None:
+                        # may be called from connection's thread - wake feed() via its loop
+                        try:
+                            if loop is not None:
+                                loop.call_soon_threadsafe(progress_event.set)
+                            else:
+                                progress_event.set()
+                        except RuntimeError:  # loop already closed
+                            pass
+
+        def unsubscribe_data_path():
+            # idempotent: called eagerly when observer gets done and again from feed()'s finally
+            if not secure_data_received._unsubscribed:
+                secure_data_received._unsubscribed = True
+                self.logger.debug("unsubscribing %s", connection_observer)
+                moler_conn.unsubscribe(observer=secure_data_received,
+                                       connection_closed_handler=connection_observer.connection_closed_handler)
+
+        secure_data_received._unsubscribed = False
+        secure_data_received.unsubscribe_data_path = unsubscribe_data_path
+        self.logger.debug("subscribing for data %s", connection_observer)
         moler_conn.subscribe(observer=secure_data_received,
                              connection_closed_handler=connection_observer.connection_closed_handler)
         if connection_observer.is_command():
             connection_observer.send_command()
         return secure_data_received  # to know what to unsubscribe
 
-    async def feed(self, connection_observer, subscribed_data_receiver, observer_lock):
+    async def feed(self, connection_observer, subscribed_data_receiver, observer_lock, progress_event=None):
         """
         Feeds connection_observer by transferring data from connection and passing it to connection_observer.
         Should be called from background-processing of connection observer.
         """
-        remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
-                                              from_start_time=connection_observer.life_status.start_time)
-        self.logger.debug("{} started, {}".format(connection_observer, msg))
-        connection_observer._log(logging.INFO, "{} started, {}".format(connection_observer.get_long_desc(), msg))
+        if connection_observer.logger.isEnabledFor(logging.INFO) or self.logger.isEnabledFor(logging.DEBUG):
+            remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
+                                                  from_start_time=connection_observer.life_status.start_time)
+            self.logger.debug("%s started, %s", connection_observer, msg)
+            connection_observer._log(logging.INFO, "{} started, {}".format(connection_observer.get_long_desc(), msg))
 
         if not subscribed_data_receiver:
             subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
 
-        await asyncio.sleep(0.005)  # give control back before we start processing
+        await asyncio.sleep(0)  # give control back before we start processing; no TimerHandle, just one yield
         start_time = connection_observer.life_status.start_time
 
         moler_conn = connection_observer.connection
+        # hot-loop locals: skip repeated attribute lookups per iteration
+        observer_done = connection_observer.done
+        now = time.time
         try:
             while True:
-                if connection_observer.done():
-                    self.logger.debug("done {}".format(connection_observer))
+                if observer_done():
+                    self.logger.debug("done %s", connection_observer)
                     break
-                run_duration = time.time() - start_time
-                # we need to check connection_observer.timeout at each round since timeout may change
+                run_duration = now() - start_time
+                # we need to re-read connection_observer.timeout at each round since timeout may change
                 # during lifetime of connection_observer
-                if (connection_observer.timeout is not None) and (run_duration >= connection_observer.timeout):
+                observer_timeout = connection_observer.timeout
+                if (observer_timeout is not None) and (run_duration >= observer_timeout):
                     with observer_lock:
                         time_out_observer(connection_observer,
-                                          timeout=connection_observer.timeout,
+                                          timeout=observer_timeout,
                                           passed_time=run_duration,
                                           runner_logger=self.logger)
                     break
                 if self._in_shutdown:
-                    self.logger.debug("shutdown so cancelling {}".format(connection_observer))
+                    self.logger.debug("shutdown so cancelling %s", connection_observer)
                     connection_observer.cancel()
-                await asyncio.sleep(0.005)  # give moler_conn a chance to feed observer
+                if progress_event is None:
+                    await asyncio.sleep(0.005)  # give moler_conn a chance to feed observer
+                else:
+                    # event-driven wakeup: data-path sets progress_event when observer gets done;
+                    # wait slice stays at the old 5 ms poll scale since observer.timeout may be
+                    # shortened by another thread at any moment and must be noticed promptly
+                    try:
+                        await asyncio.wait_for(progress_event.wait(), timeout=0.005)
+                    except asyncio.TimeoutError:
+                        pass
+                    progress_event.clear()
             #
             # main purpose of feed() is to progress observer-life by time
             #             firing timeout should do: observer.set_exception(Timeout)
@@ -621,32 +689,43 @@ class AsyncioRunner(ConnectionObserverRunner):
             # Another words - it is not feed's exception but observer's exception so, it should not be raised here.
             #
         except asyncio.CancelledError:
-            self.logger.debug("cancelling {}.feed".format(self))
+            self.logger.debug("cancelling %s.feed", self)
             # cancelling connection_observer is done inside handle_cancelled_feeder()
             raise  # need to reraise to inform "I agree for cancellation"
 
         finally:
-            self.logger.debug("unsubscribing {}".format(connection_observer))
-            moler_conn.unsubscribe(observer=subscribed_data_receiver,
-                                   connection_closed_handler=connection_observer.connection_closed_handler)
+            subscribed_data_receiver.unsubscribe_data_path()
             # feed_done.set()
 
-            remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
-                                                  from_start_time=connection_observer.life_status.start_time)
-            connection_observer._log(logging.INFO, "{} finished, {}".format(connection_observer.get_short_desc(), msg))
-            self.logger.debug("{} finished, {}".format(connection_observer, msg))
+            if connection_observer.logger.isEnabledFor(logging.INFO) or self.logger.isEnabledFor(logging.DEBUG):
+                remain_time, msg = his_remaining_time("remaining", timeout=connection_observer.timeout,
+                                                      from_start_time=connection_observer.life_status.start_time)
+                connection_observer._log(logging.INFO, "{} finished, {}".format(connection_observer.get_short_desc(), msg))
+                self.logger.debug("%s finished, %s", connection_observer, msg)
         return None
 
     def timeout_change(self, timedelta):
         pass
 
 
-class AsyncioEventThreadsafe(asyncio.Event):
+class LoopStopEvent(object):
+    """
+    Duck-types the done_event expected by TillDoneThread: set() requests loop stop.
+
+    Cheaper than the previous asyncio.Event + awaiting coroutine handshake -
+    stopping costs one call_soon_threadsafe and run_forever() returning.
+    """
+    def __init__(self, loop):
+        self._loop = loop
+
     def set(self):
-        self._loop.call_soon_threadsafe(super().set)
+        try:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        except RuntimeError:  # loop already closed
+            pass
 
     def clear(self):
-        self._loop.call_soon_threadsafe(super().clear)
+        pass
 
 
 class AsyncioInThreadRunner(AsyncioRunner):
@@ -655,7 +734,14 @@ class AsyncioInThreadRunner(AsyncioRunner):
         super(AsyncioInThreadRunner, self).__init__(logger_name='moler.runner.asyncio-in-thrd')
         # AsyncioLoopThread must be created from MainThread since it adds signal handlers
         # (AsyncioLoopThread needs unix watchers embeding signal handles used to stop subprocesses)
-        get_asyncio_loop_thread()
+        self._thread4async = get_asyncio_loop_thread()
+
+    @property
+    def thread4async(self):
+        """Loop-thread handle cached per runner - direct attribute load on hot paths"""
+        if self._thread4async is None:
+            self._thread4async = get_asyncio_loop_thread()
+        return self._thread4async
 
     def shutdown(self):
         self.logger.debug("shutting down")
@@ -672,7 +758,7 @@ class AsyncioInThreadRunner(AsyncioRunner):
         Submit connection observer to background execution.
         Returns Future that could be used to await for connection_observer done.
         """
-        self.logger.debug("go background: {!r}".format(connection_observer))
+        self.logger.debug("go background: %r", connection_observer)
 
         # TODO: check dependency - connection_observer.connection
 
@@ -701,29 +787,34 @@ class AsyncioInThreadRunner(AsyncioRunner):
         # by MolerException.
 
         async def start_feeder():
-            feed_started = asyncio.Event()
-            self.logger.debug("scheduling feed({})".format(connection_observer))
+            observer_lock = threading.Lock()  # against threads race write-access to observer
+            self.logger.debug("scheduling feed(%s)", connection_observer)
+            # subscribing here (inside loop-thread, before returning from submit)
+            # gives the same "no data lost after submit()" guarantee the old
+            # feed_started handshake provided, but without awaiting feed() startup
+            subscribed_data_receiver = self._start_feeding(connection_observer, observer_lock)
             conn_observer_future = asyncio.ensure_future(self.feed(connection_observer,
-                                                                   feed_started,
-                                                                   subscribed_data_receiver=None))
-            self.logger.debug("scheduled feed() - future: {}".format(conn_observer_future))
-            await feed_started.wait()
-            self.logger.debug("feed() started - future: {}:{}".format(instance_id(conn_observer_future),
-                                                                      conn_observer_future))
+                                                                   subscribed_data_receiver,
+                                                                   observer_lock))
+            # identity never changes - tag future once, reuse in any later debug line
+            conn_observer_future._dbg_tag = fut_tag = instance_id(conn_observer_future)
+            self.logger.debug("scheduled feed() - future: %s:%s", fut_tag, conn_observer_future)
             return conn_observer_future
 
-        thread4async = get_asyncio_loop_thread()
+        thread4async = self.thread4async
         start_timeout = 0.5
         try:
-            connection_observer_future = thread4async.run_async_coroutine(start_feeder(), timeout=start_timeout)
-        except MolerTimeout:
+            connection_observer_future = _submit_coro_nowrap(thread4async.ev_loop,
+                                                             start_feeder()).result(timeout=start_timeout)
+        except concurrent.futures.TimeoutError:
             err_msg = "Failed to start observer feeder within {} sec".format(start_timeout)
             self.logger.error(err_msg)
             exc = MolerException(err_msg)
             connection_observer.set_exception(exception=exc)
             return None
-        self.logger.debug("runner submit() returning - future: {}:{}".format(instance_id(connection_observer_future),
-                                                                             connection_observer_future))
+        self.logger.debug("runner submit() returning - future: %s:%s",
+                          getattr(connection_observer_future, '_dbg_tag', None),
+                          connection_observer_future)
         return connection_observer_future
 
     def wait_for(self, connection_observer, connection_observer_future, timeout=None):
@@ -735,52 +826,74 @@ class AsyncioInThreadRunner(AsyncioRunner):
         :param timeout: Max time (in float seconds) to await before give up. None - use connection_observer.timeout
         :return:
         """
-        self.logger.debug("go foreground: {!r} - await max. {} [sec]".format(connection_observer, timeout))
+        self.logger.debug("go foreground: %r - await max. %s [sec]", connection_observer, timeout)
         if connection_observer.done():  # may happen when failed to start observer feeder
             return None
-        start_time = time.time()
-
-        async def wait_for_connection_observer_done():
-            result_of_future = await connection_observer_future  # feed() always returns None
-            return result_of_future
+        start_time = time.monotonic()
+
+        def observer_future_done(future):
+            # runs inside loop-thread; propagate outcome to awaiting caller-thread
+            if bridge.done():  # max-timeout timer fired first
+                return
+            if future.cancelled():
+                bridge.cancel()
+            elif future.exception() is not None:
+                bridge.set_exception(future.exception())
+            else:
+                bridge.set_result(None)  # feed() always returns None
 
-        thread4async = get_asyncio_loop_thread()
+        thread4async = self.thread4async
         try:
-            event_loop, its_new = thread_secure_get_event_loop()
-            if event_loop.is_running():
-                # wait_for() should not be called from 'async def'
+            # wait_for() should not be called from 'async def' - probe for a running
+            # loop directly (C-level read) instead of get_event_loop machinery which
+            # may even create a loop for this thread as a side effect
+            if asyncio._get_running_loop() is not None:
                 self._raise_wrong_usage_of_wait_for(connection_observer)
 
-            # If we have have timeout=None then concurrent.futures will wait infinitely
+            # If we have timeout=None then we block infinitely here
             # and feed() inside asyncio-loop will work on connection_observer.timeout
             #
-            # If timeout is given then it defines max timeout (from "now") that concurrent.futures
-            # may use to shorten lifetime of feed().
-            # In such case we have concurrent.futures and asyncio race here - race about timeouts.
-            thread4async.run_async_coroutine(wait_for_connection_observer_done(), timeout=timeout)
+            # If timeout is given then it defines max timeout (from "now") that may
+            # shorten lifetime of feed(). The timer lives inside the event loop, so
+            # "observer done" and "max timeout fired" are serialized on the loop thread
+            # - no concurrent.futures-vs-asyncio race about timeouts anymore.
+            #
+            # connection_observer_future already lives on the loop - block on it through a plain
+            # bridge future instead of spinning up a wrapper coroutine + Task just to await it
+            bridge = concurrent.futures.Future()
+
+            def setup_wait():
+                connection_observer_future.add_done_callback(observer_future_done)
+                if timeout is not None:
+                    def on_max_timeout():
+                        if not bridge.done():
+                            bridge.set_exception(concurrent.futures.TimeoutError())
+                    timer_handle = thread4async.ev_loop.call_later(timeout, on_max_timeout)
+                    connection_observer_future.add_done_callback(lambda future: timer_handle.cancel())
+
+            thread4async.ev_loop.call_soon_threadsafe(setup_wait)
+            bridge.result()
             # If feed() inside asyncio-loop handles timeout as first - we exit here.
             return None
-        except MolerTimeout:
-            # If run_async_coroutine() times out - we follow from here.
+        except concurrent.futures.TimeoutError:
+            # If awaiting the bridge times out - we follow from here.
             pass
         except concurrent.futures.CancelledError:
             connection_observer.cancel()
             return None
         except Exception as err:
-            err_msg = "{} raised {!r}".format(connection_observer, err)
-            self.logger.debug(err_msg)
+            self.logger.debug("%s raised %r", connection_observer, err)
             if connection_observer._exception != err:
                 connection_observer.set_exception(err)
             return None  # will be reraised during call to connection_observer.result()
         finally:
-            # protect against leaking coroutines
+            # protect against leaking coroutines; cancel() is a plain sync call,
+            # one call_soon_threadsafe hop suffices - no coroutine/Task needed
             if not connection_observer_future.done():
-                async def conn_observer_fut_cancel():
-                    connection_observer_future.cancel()
-                thread4async.start_async_coroutine(conn_observer_fut_cancel())
+                thread4async.ev_loop.call_soon_threadsafe(connection_observer_future.cancel)
 
         # handle timeout
-        passed = time.time() - start_time
+        passed = time.monotonic() - start_time
         fired_timeout = timeout if timeout else connection_observer.timeout
         time_out_observer(connection_observer=connection_observer,
                           timeout=fired_timeout, passed_time=passed,
@@ -798,20 +911,29 @@ class AsyncioInThreadRunner(AsyncioRunner):
         :param connection_observer_future: Future of connection-observer returned from submit().
         :return: iterator
         """
-        self.logger.debug("returning iterator for {}".format(connection_observer))
-        while not connection_observer_future.done():
-            yield None
-        # return result_for_runners(connection_observer)  # May raise too.   # Python > 3.3
-        res = result_for_runners(connection_observer)
-        raise StopIteration(res)  # Python 2 compatibility
+        self.logger.debug("returning iterator for %s", connection_observer)
+        # connection_observer_future lives on the dedicated loop-thread, so we can't
+        # "yield from" it directly (future attached to a different loop). Bridge it
+        # into a future of the awaiting caller's loop - the outer task then suspends
+        # until completion instead of re-entering this generator on every loop tick.
+        bridge = concurrent.futures.Future()
+
+        def observer_future_done(future):
+            if not bridge.done():
+                bridge.set_result(None)
+
+        thread4async = self.thread4async
+        thread4async.ev_loop.call_soon_threadsafe(connection_observer_future.add_done_callback,
+                                                  observer_future_done)
+        yield from asyncio.wrap_future(bridge).__await__()
+        return result_for_runners(connection_observer)  # May raise too.
 
 
 def cleanup_remaining_tasks(loop, logger):
     # https://stackoverflow.com/questions/30765606/whats-the-correct-way-to-clean-up-after-an-interrupted-event-loop
     # https://medium.com/python-pandemonium/asyncio-coroutine-patterns-beyond-await-a6121486656f
     # Handle shutdown gracefully by waiting for all tasks to be cancelled
-    all_tasks = [task for task in asyncio.Task.all_tasks(loop=loop)]
-    not_done_tasks = [task for task in asyncio.Task.all_tasks(loop=loop) if not task.done()]
+    not_done_tasks = [task for task in asyncio.all_tasks(loop=loop) if not task.done()]
     if not_done_tasks:
         logger.info("cancelling all remaining tasks")
         # NOTE: following code cancels all tasks - possibly not ours as well
@@ -820,20 +942,69 @@ def cleanup_remaining_tasks(loop, logger):
 
 
 def cleanup_selected_tasks(tasks2cancel, loop, logger):
-    logger.debug("tasks to cancel: {}".format(tasks2cancel))
-    remaining_tasks = asyncio.gather(*tasks2cancel, loop=loop, return_exceptions=True)
-    remaining_tasks.add_done_callback(lambda t: loop.stop())
-    remaining_tasks.cancel()
+    logger.debug("tasks to cancel: %s", tasks2cancel)
+    # cancel each task directly - gather(return_exceptions=True) swallows cancellation
+    # and needs an extra future + done-callback/loop.stop indirection
+    for task in tasks2cancel:
+        task.cancel()
+    # Keep the event loop running until all tasks have really terminated
+    loop.run_until_complete(asyncio.wait(tasks2cancel))
+
+
+if sys.version_info >= (3, 11):
+    def _create_task_no_context(loop, coro):
+        # fresh empty Context instead of copying the caller's ambient context;
+        # moler coroutines don't read context-vars so the copy is pure waste
+        return loop.create_task(coro, context=contextvars.Context())
+else:
+    def _create_task_no_context(loop, coro):
+        return loop.create_task(coro)
+
+
+def _submit_coro_nowrap(loop, coro):
+    """
+    Schedule coroutine on loop of another thread; return concurrent.futures.Future with its outcome.
+
+    Leaner than asyncio.run_coroutine_threadsafe: single call_soon_threadsafe hop
+    and a plain done-callback instead of the _chain_future bridge machinery.
+    """
+    bridged_future = concurrent.futures.Future()
+
+    def _copy_outcome(task):
+        if task.cancelled():
+            bridged_future.cancel()
+            return
+        task_exception = task.exception()
+        if task_exception is not None:
+            bridged_future.set_exception(task_exception)
+        else:
+            bridged_future.set_result(task.result())
+
+    def _launch():
+        try:
+            task = _create_task_no_context(loop, coro)
+        except BaseException as exc:
+            bridged_future.set_exception(exc)
+            raise
+        task.add_done_callback(_copy_outcome)
 
-    # Keep the event loop running until it is either destroyed or all
-    # tasks have really terminated
-    loop.run_until_complete(remaining_tasks)
+    loop.call_soon_threadsafe(_launch)
+    return bridged_future
 
 
 class AsyncioLoopThread(TillDoneThread):
     def __init__(self, name="Asyncio"):
         self.logger = logging.getLogger('moler.asyncio-loop-thrd')
-        self.ev_loop = asyncio.new_event_loop()
+        self.ev_loop = None
+        if os.environ.get("MOLER_USE_UVLOOP") == "1":
+            # libuv-backed drop-in loop, 2-4x scheduler throughput; opt-in to allow rollback
+            try:
+                import uvloop
+                self.ev_loop = uvloop.new_event_loop()
+            except ImportError:
+                pass
+        if self.ev_loop is None:
+            self.ev_loop = asyncio.new_event_loop()
 
         # to allow subprocesses running in "subthread"
         # otherwise we get error:
@@ -846,24 +1017,30 @@ class AsyncioLoopThread(TillDoneThread):
         #   Python interpreter can process signals only in main thread.
         # answer by: https://stackoverflow.com/users/3454879/andrew-svetlov
         #
-        asyncio.get_child_watcher().attach_loop(self.ev_loop)
-
-        self.ev_loop.set_debug(enabled=True)
-
-        self.logger.debug("created asyncio loop: {}:{}".format(id(self.ev_loop), self.ev_loop))
-        self.ev_loop_done = AsyncioEventThreadsafe(loop=self.ev_loop)
-        self.ev_loop_done.clear()
+        # Attaching the watcher installs a SIGCHLD handler - pure overhead when moler
+        # never spawns asyncio subprocesses, and child watchers are gone on 3.12+.
+        # Opt-in via MOLER_ENABLE_SUBPROCESS=1 for users running subprocesses in the loop.
+        if os.environ.get("MOLER_ENABLE_SUBPROCESS") == "1":
+            if hasattr(asyncio, "get_child_watcher") and (sys.platform != "win32"):
+                asyncio.get_child_watcher().attach_loop(self.ev_loop)
+
+        # asyncio debug mode records tracebacks for every coroutine, times each callback
+        # and checks call_soon thread-affinity - development aid, way too slow as default
+        if os.environ.get("MOLER_ASYNCIO_DEBUG") == "1":
+            self.ev_loop.set_debug(enabled=True)
+
+        self.logger.debug("created asyncio loop: %s:%s", id(self.ev_loop), self.ev_loop)
+        self.ev_loop_done = LoopStopEvent(loop=self.ev_loop)
         self.ev_loop_started = threading.Event()
 
         super(AsyncioLoopThread, self).__init__(target=self._start_loop,
                                                 done_event=self.ev_loop_done,
                                                 kwargs={'loop': self.ev_loop,
-                                                        'loop_started': self.ev_loop_started,
-                                                        'loop_done': self.ev_loop_done})
+                                                        'loop_started': self.ev_loop_started})
         # Thread-3  -->  [Thread, 3]
         name_parts = self.name.split('-')
         self.name = "{}-{}".format(name, name_parts[-1])
-        self.logger.debug("created thread {} for asyncio loop".format(self))
+        self.logger.debug("created thread %s for asyncio loop", self)
 
     def start(self):
         """
@@ -878,6 +1055,7 @@ class AsyncioLoopThread(TillDoneThread):
             self.ev_loop_done.set()
             raise MolerException(err_msg)
         self.logger.info("started new asyncio-loop-thrd ...")
+        _started_loop_threads.append(self)  # joined at interpreter shutdown; append is atomic under GIL
 
     def join(self, timeout=None):
         """
@@ -888,40 +1066,36 @@ class AsyncioLoopThread(TillDoneThread):
         self.logger.info("finished asyncio-loop-thrd ...")
         self.logger.info("closing events loop ...")
         sys.stderr.write("CLOSING EV_LOOP of AsyncioLoopThread {!r}\n".format(self.ev_loop))
-        for still_running_tasks in asyncio.Task.all_tasks(loop=self.ev_loop):
+        for still_running_tasks in asyncio.all_tasks(loop=self.ev_loop):
             sys.stderr.write("AsyncioLoopThread has still running task: {!r}\n".format(still_running_tasks))
         self.ev_loop.close()
         self.logger.info("... asyncio loop closed")
 
-    def _start_loop(self, loop, loop_started, loop_done):
+    def _start_loop(self, loop, loop_started):
+        # loop stop is requested via self.ev_loop_done.set() - either explicitly through join()
+        # or by the atexit hook stopping pooled loop threads at interpreter shutdown
+        # (since Python 3.9 shutdown no longer joins non-daemon threads itself - bpo-36402)
         asyncio.set_event_loop(loop)
+        loop.call_soon(loop_started.set)  # signal "really running" from inside the loop
         try:
             self.logger.info("starting new asyncio loop ...")
-            loop.run_until_complete(self._await_stop_loop(loop_started=loop_started, stop_event=loop_done))
+            loop.run_forever()
             # cleanup_remaining_tasks(loop=loop, logger=self.logger)
         finally:
             self.logger.info("asyncio loop is done ...")
 
-    async def _await_stop_loop(self, loop_started, stop_event):
-        # stop_event may be set directly via self._loop_done.set()
-        # or indirectly by TillDoneThread when python calls join on all active threads during python shutdown
-        self.logger.info("will await loop stop_event ...")
-        loop_started.set()
-        await stop_event.wait()
-        self.logger.info("... await loop stop_event done")
-
     def run_async_coroutine(self, coroutine_to_run, timeout):
         """Start coroutine in dedicated thread and await its result with timeout"""
-        start_time = time.time()
+        start_time = time.monotonic()
         coro_future = self.start_async_coroutine(coroutine_to_run)
         # run_coroutine_threadsafe returns future as concurrent.futures.Future() and not asyncio.Future
         # so, we can await it with timeout inside current thread
         try:
             coro_result = coro_future.result(timeout=timeout)
-            self.logger.debug("scheduled {} returned {}".format(coroutine_to_run, coro_result))
+            self.logger.debug("scheduled %s returned %s", coroutine_to_run, coro_result)
             return coro_result
         except concurrent.futures.TimeoutError:
-            passed = time.time() - start_time
+            passed = time.monotonic() - start_time
             raise MolerTimeout(timeout=timeout,
                                kind="run_async_coroutine({})".format(coroutine_to_run),
                                passed_time=passed)
@@ -931,27 +1105,63 @@ class AsyncioLoopThread(TillDoneThread):
     def start_async_coroutine(self, coroutine_to_run):
         """Start coroutine in dedicated thread, don't await its result"""
         # we are scheduling to other thread (so, can't use asyncio.ensure_future() )
-        self.logger.debug("scheduling {} into {}".format(coroutine_to_run, self.ev_loop))
+        self.logger.debug("scheduling %s into %s", coroutine_to_run, self.ev_loop)
         coro_future = asyncio.run_coroutine_threadsafe(coroutine_to_run, loop=self.ev_loop)
         return coro_future
 
 
-_asyncio_loop_thread = None
+_asyncio_loop_threads = []
 _asyncio_loop_thread_lock = threading.Lock()
+_asyncio_loop_thread_tls = threading.local()  # per-thread cache to skip even the global read
+# Historical behaviour is one shared loop thread (pool size 1). Setting
+# MOLER_ASYNCIO_LOOPS=N spreads observers round-robin over N loop threads
+# so heavy multi-connection workloads are not serialized on a single loop.
+_asyncio_loop_threads_max = max(1, int(os.environ.get("MOLER_ASYNCIO_LOOPS", "1")))
+_asyncio_loop_threads_rr = itertools.count()
 
 
-def get_asyncio_loop_thread():
-    logger = logging.getLogger('moler.asyncio-loop-thrd')
+# every AsyncioLoopThread that got started - pooled or standalone; its join()
+# (which stops the loop) must be called explicitly at interpreter shutdown
+_started_loop_threads = []
+
+
+def _shutdown_asyncio_loop_threads():
+    # loop threads are non-daemonic and run_forever() never returns on its own;
+    # Python 3.9+ stopped calling join() on non-daemon threads at interpreter
+    # shutdown (bpo-36402), so without this hook any process using them hangs at exit
     with _asyncio_loop_thread_lock:
-        global _asyncio_loop_thread
-        if _asyncio_loop_thread is None:
-            logger.debug(">>> >>> found _asyncio_loop_thread as {}".format(_asyncio_loop_thread))
-
-            logger.debug(">>> >>> will create thread {}".format(_asyncio_loop_thread))
-            new_loop_thread = AsyncioLoopThread()
-            logger.debug(">>> >>> AsyncioLoopThread() --> {}".format(new_loop_thread))
-            new_loop_thread.start()
-            logger.debug(">>> >>> started {}".format(new_loop_thread))
-            _asyncio_loop_thread = new_loop_thread
-    logger.debug(">>> >>> returning {}".format(_asyncio_loop_thread))
-    return _asyncio_loop_thread
+        del _asyncio_loop_threads[:]
+    while _started_loop_threads:
+        loop_thread = _started_loop_threads.pop()
+        loop_thread.join()
+
+
+try:
+    # must run before interpreter starts waiting on non-daemon threads
+    # (same mechanism concurrent.futures uses for its worker threads)
+    threading._register_atexit(_shutdown_asyncio_loop_threads)
+except AttributeError:  # pre-3.9 shutdown still calls join() on each thread itself
+    atexit.register(_shutdown_asyncio_loop_threads)
+
+
+def get_asyncio_loop_thread():
+    loop_thread = getattr(_asyncio_loop_thread_tls, 'loop_thread', None)
+    if loop_thread is not None:
+        return loop_thread
+    # double-checked locking: lock-free read on the common post-initialization path
+    pool = _asyncio_loop_threads
+    if len(pool) < _asyncio_loop_threads_max:
+        with _asyncio_loop_thread_lock:
+            while len(pool) < _asyncio_loop_threads_max:
+                logger = logging.getLogger('moler.asyncio-loop-thrd')
+                logger.debug(">>> >>> will create asyncio loop thread")
+                loop_thread = AsyncioLoopThread()
+                logger.debug(">>> >>> AsyncioLoopThread() --> %s", loop_thread)
+                loop_thread.start()
+                logger.debug(">>> >>> started %s", loop_thread)
+                pool.append(loop_thread)
+    # each calling thread sticks to its assigned loop thread (cached below),
+    # so observers of one runner/thread always land on one loop
+    loop_thread = pool[next(_asyncio_loop_threads_rr) % len(pool)]
+    _asyncio_loop_thread_tls.loop_thread = loop_thread
+    return loop_thread
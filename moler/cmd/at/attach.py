@@ -21,6 +21,8 @@ class Attach(GenericAtCommand):
     AT+CGATT=1
     OK
     """
+    _COMMAND_STR = "AT+CGATT=1"  # constant - built once, not per execution
+
     def __init__(self, connection=None, prompt=None, newline_chars=None, runner=None):
         """Create instance of Attach class"""
         super(Attach, self).__init__(connection, operation="execute", prompt=prompt,
@@ -29,7 +31,7 @@ class Attach(GenericAtCommand):
         self.ret_required = False
 
     def build_command_string(self):
-        return "AT+CGATT=1"
+        return self._COMMAND_STR
 
 
 # -----------------------------------------------------------------------------
@@ -23,9 +23,7 @@ __email__ = 'grzegorz.latuszek@nokia.com'
 
 import re
 from moler.cmd.unix.genericunix import GenericUnixCommand
-from moler.util.converterhelper import ConverterHelper
 from moler.exceptions import CommandFailure
-from moler.exceptions import ParsingDone
 from moler.publisher import Publisher
 
 
@@ -76,17 +74,39 @@ class Iperf2(GenericUnixCommand, Publisher):
         """
         super(Iperf2, self).__init__(connection=connection, prompt=prompt, newline_chars=newline_chars, runner=runner)
         self.port, self.options = self._validate_options(options)
-        self.current_ret['CONNECTIONS'] = dict()
+        self._port_str = str(self.port)  # lets connection lines compare ports without int() parse
+        # option-derived characteristics never change after construction;
+        # compute them once so per-line handlers don't re-scan options
+        self._protocol = 'udp' if self._parse_udp_option() else 'tcp'
+        self._interval = self._parse_interval_option()
+        self._time = self._parse_time_option()
+        self._is_dualtest = ('--dualtest' in self.options) or ('-d' in self.options)
+        self._is_client = ('-c ' in self.options) or ('--client ' in self.options)
+        self._is_server = self.options.startswith('-s') or (' -s' in self.options) or ('--server' in self.options)
+        self._is_singlerun_server = (('-P 1 ' in self.options) or ('--parallel 1 ' in self.options)
+                                     or self.options.endswith('-P 1') or self.options.endswith('--parallel 1'))
+        # _connections aliases current_ret['CONNECTIONS'] so per-record code
+        # skips two dict lookups on every access; both names see same dict
+        self._connections = dict()
+        self.current_ret['CONNECTIONS'] = self._connections
         self.current_ret['INFO'] = list()
 
         # private values
         self._connection_dict = dict()
         self._same_host_connections = dict()
-        self._converter_helper = ConverterHelper()
+        self._split_conn_cache = dict()
+        self._is_parallel_client = None
         self._got_server_report_hdr = False
         self._got_server_report = False
         self._stopping_server = False
 
+        # bind compiled-regex methods once; per-line handlers then do a single
+        # C-level call instead of helper dispatch + attribute lookups
+        self._match_record = Iperf2._re_iperf_record.match
+        self._match_conn_info = Iperf2._re_connection_info.match
+        self._match_headers = Iperf2._re_headers.match
+        self._search_interrupt = Iperf2._re_interrupt_again.search
+
     def __str__(self):
         str_base_value = super(Iperf2, self).__str__()
         str_value = "{}, awaited_prompt='{}')".format(str_base_value[:-1], self._re_prompt.pattern)
@@ -107,31 +127,38 @@ class Iperf2(GenericUnixCommand, Publisher):
         cmd = 'iperf ' + str(self.options)
         return cmd
 
+    def _parse_udp_option(self):
+        return self.options.startswith('-u') or (' -u' in self.options) or ('--udp' in self.options)
+
     @property
     def protocol(self):
-        if self.options.startswith('-u') or (' -u' in self.options) or ('--udp' in self.options):
-            return 'udp'
-        return 'tcp'
+        return self._protocol
 
     _re_interval = re.compile(r"(?P<INTERVAL_OPTION>\-\-interval|\-i)\s+(?P<INTERVAL>[\d\.]+)")
 
-    @property
-    def interval(self):
+    def _parse_interval_option(self):
         if self._regex_helper.search_compiled(Iperf2._re_interval, self.options):
             return float(self._regex_helper.group('INTERVAL'))
         return 0.0
 
+    @property
+    def interval(self):
+        return self._interval
+
     _re_time = re.compile(r"(?P<TIME_OPTION>\-\-time|\-t)\s+(?P<TIME>[\d\.]+)")
 
-    @property
-    def time(self):
+    def _parse_time_option(self):
         if self._regex_helper.search_compiled(Iperf2._re_time, self.options):
             return float(self._regex_helper.group('TIME'))
         return 10.0
 
+    @property
+    def time(self):
+        return self._time
+
     @property
     def dualtest(self):
-        return ('--dualtest' in self.options) or ('-d' in self.options)
+        return self._is_dualtest
 
     @property
     def works_in_dualtest(self):
@@ -144,14 +171,21 @@ class Iperf2(GenericUnixCommand, Publisher):
 
     @property
     def client(self):
-        return ('-c ' in self.options) or ('--client ' in self.options)
+        return self._is_client
 
     @property
     def server(self):
-        return self.options.startswith('-s') or (' -s' in self.options) or ('--server' in self.options)
+        return self._is_server
 
     @property
     def parallel_client(self):
+        # recomputation is O(number of connections) so cache result;
+        # cache is invalidated whenever _connection_dict grows
+        if self._is_parallel_client is None:
+            self._is_parallel_client = self._compute_parallel_client()
+        return self._is_parallel_client
+
+    def _compute_parallel_client(self):
         if self.client:
             return ('-P ' in self.options) or ('--parallel ' in self.options)
         if len(self._connection_dict.keys()) > 1:
@@ -165,24 +199,30 @@ class Iperf2(GenericUnixCommand, Publisher):
 
     @property
     def singlerun_server(self):
-        singlerun_param_nonlast = ('-P 1 ' in self.options) or ('--parallel 1 ' in self.options)
-        singlerun_param_as_last = self.options.endswith('-P 1') or self.options.endswith('--parallel 1')
-        return singlerun_param_nonlast or singlerun_param_as_last
+        return self._is_singlerun_server
 
     def on_new_line(self, line, is_full_line):
         if is_full_line:
-            try:
-                self._command_failure(line)
-                self._parse_connection_name_and_id(line)
-                self._parse_headers(line)
-                self._parse_connection_info(line)
-                self._parse_too_early_ctrl_c(line)
-                self._parse_svr_report_header(line)
-                self._parse_connection_headers(line)
-            except ParsingDone:
-                pass
+            self._parse_line(line)
         return super(Iperf2, self).on_new_line(line, is_full_line)
 
+    def _parse_line(self, line):
+        # handlers return True when they consume the line; plain returns avoid
+        # constructing a throwaway ParsingDone exception per parsed line
+        if self._command_failure(line):
+            return
+        if self._parse_connection_name_and_id(line):
+            return
+        if self._parse_headers(line):
+            return
+        if self._parse_connection_info(line):
+            return
+        if self._parse_too_early_ctrl_c(line):
+            return
+        if self._parse_svr_report_header(line):
+            return
+        self._parse_connection_headers(line)
+
     def _process_line_from_command(self, current_chunk, line, is_full_line):
         decoded_line = self._decode_line(line=line)
         if self._is_replicated_cmd_echo(line):
@@ -194,6 +234,20 @@ class Iperf2(GenericUnixCommand, Publisher):
         found_echo = self._regex_helper.search(prompt_and_command, line)
         return found_echo is not None
 
+    def parse_buffer(self, buffer):
+        """
+        Parse complete iperf output in one pass.
+
+        Intended for offline replay of captured transcripts: runs the same
+        parsing handlers as on_new_line but splits the whole text once and
+        skips the per-line prompt/echo machinery of live command execution.
+
+        :param buffer: multiline string with captured iperf output.
+        :return: None (parsed data lands in self.current_ret)
+        """
+        for line in buffer.splitlines():
+            self._parse_line(line)
+
     def subscribe(self, subscriber):
         """
         Subscribe for notifications about iperf statistic as it comes.
@@ -250,25 +304,30 @@ class Iperf2(GenericUnixCommand, Publisher):
                 self._schedule_delayed_break(delay=1.0)
             self._stopping_server = True
 
-    _re_command_failure = re.compile(r"(?P<FAILURE_MSG>.*failed.*|.*error.*|.*command not found.*|.*iperf:.*)")
+    _failure_keywords = ('failed', 'error', 'command not found', 'iperf:')
 
     def _command_failure(self, line):
-        if self._regex_helper.search_compiled(Iperf2._re_command_failure, line):
-            self.set_exception(CommandFailure(self, "ERROR: {}".format(self._regex_helper.group("FAILURE_MSG"))))
-            raise ParsingDone
+        # former regex was .*failed.*|.*error.*|... capturing whole line anyway,
+        # so plain substring checks give same result without regex backtracking
+        for keyword in Iperf2._failure_keywords:
+            if keyword in line:
+                self.set_exception(CommandFailure(self, "ERROR: {}".format(line)))
+                return True
+        return False
 
     # [  3] local 192.168.0.12 port 5016 connected with 192.168.0.10 port 56262
     # [  5] local 192.168.0.12 port 47384 connected with 192.168.0.10 port 5016
     # [  4] local fd00::2:0 port 49597 connected with fd00::1:0 port 5901
-    _r_conn_info = r"(\[\s*\d*\])\s+local\s+(\S+)\s+port\s+(\d+)\s+connected with\s+(\S+)\s+port\s+(\d+)"
+    _r_conn_info = r"^\s*(\[\s*\d*\])\s+local\s+(\S+)\s+port\s+(\d+)\s+connected with\s+(\S+)\s+port\s+(\d+)"
     _re_connection_info = re.compile(_r_conn_info)
 
     def _parse_connection_name_and_id(self, line):
-        if self._regex_helper.search_compiled(Iperf2._re_connection_info, line):
-            connection_id, local_host, local_port, remote_host, remote_port = self._regex_helper.groups()
+        found = self._match_conn_info(line) if 'connected with' in line else None
+        if found:
+            connection_id, local_host, local_port, remote_host, remote_port = found.groups()
             local = "{}@{}".format(local_port, local_host)
             remote = "{}@{}".format(remote_port, remote_host)
-            if self.port == int(remote_port):
+            if self._port_str == remote_port:
                 from_client, to_server = local, remote
                 client_host = local_host
             else:
@@ -277,21 +336,23 @@ class Iperf2(GenericUnixCommand, Publisher):
             connection = (from_client, to_server)
             connection_dict = {connection_id: connection}
             self._connection_dict.update(connection_dict)
+            self._is_parallel_client = None  # new connection may change parallel_client
             if client_host not in self._same_host_connections:
                 self._same_host_connections[client_host] = [connection]
             else:
                 self._same_host_connections[client_host].append(connection)
-            raise ParsingDone
+            return True
+        return False
 
     # iperf output for: udp client, tcp client, tcp server
     # [ ID] Interval       Transfer     Bandwidth
 
     # iperf output for: udp server
     # [ ID] Interval       Transfer     Bandwidth        Jitter   Lost/Total Datagrams
-    _re_headers = re.compile(r"\[\s+ID\]\s+Interval\s+Transfer\s+Bandwidth")
+    _re_headers = re.compile(r"^\s*\[\s+ID\]\s+Interval\s+Transfer\s+Bandwidth")
 
     def _parse_headers(self, line):
-        if self._regex_helper.search_compiled(Iperf2._re_headers, line):
+        if ('ID]' in line) and self._match_headers(line):
             if self.parallel_client:
                 # header line is after connections
                 # so, we can create virtual Summary connection
@@ -299,13 +360,20 @@ class Iperf2(GenericUnixCommand, Publisher):
                 client_host, client_port, server_host, server_port = self._split_connection_name((client, server))
                 connection_id = '[SUM]'
                 self._connection_dict[connection_id] = ("{}@{}".format("multiport", client_host), server)
-            raise ParsingDone
+                self._is_parallel_client = None
+            return True
+        return False
 
     def _split_connection_name(self, connection_name):
-        client, server = connection_name
-        client_port, client_host = client.split("@")
-        server_port, server_host = server.split("@")
-        return client_host, client_port, server_host, server_port
+        # connection names are stable - split each one only once
+        split_name = self._split_conn_cache.get(connection_name)
+        if split_name is None:
+            client, server = connection_name
+            client_port, client_host = client.split("@")
+            server_port, server_host = server.split("@")
+            split_name = (client_host, client_port, server_host, server_port)
+            self._split_conn_cache[connection_name] = split_name
+        return split_name
 
     # tcp:
     # [ ID] Interval       Transfer     Bandwidth
@@ -315,27 +383,34 @@ class Iperf2(GenericUnixCommand, Publisher):
     # [ ID] Interval       Transfer     Bandwidth        Jitter   Lost/Total Datagrams
     # [  3]  0.0- 1.0 sec   612 KBytes  5010 Kbits/sec   0.022 ms    0/  426 (0%)
 
-    _r_id = r"(?P<ID>\[\s*\d*\]|\[SUM\])"
-    _r_interval = r"(?P<Interval>[\d\.]+\-\s*[\d\.]+)\s*sec"
-    _r_transfer = r"(?P<Transfer>[\d\.]+\s+\w+)"
-    _r_bandwidth = r"(?P<Bandwidth>[\d\.]+\s+\w+/sec)"
-    _r_jitter = r"(?P<Jitter>\d+\.\d+\s\w+)"
-    _r_datagrams = r"(?P<Lost_vs_Total_Datagrams>\d+/\s*\d+)\s*\((?P<Lost_Datagrams_ratio>[\d\.]+\%)\)"
+    # numbers are spelled as \d+(?:\.\d+)? instead of [\d.]+ so the engine
+    # has no ambiguity to backtrack over on lines that almost match
+    _r_num = r"\d+(?:\.\d+)?"
+    _r_id = r"^\s*(?P<ID>\[\s*\d+\]|\[SUM\])"
+    _r_interval = r"(?P<Interval_start>{num})\-\s*(?P<Interval_end>{num})\s*sec".format(num=_r_num)
+    _r_transfer = r"(?P<Transfer>{num}\s+\w+)".format(num=_r_num)
+    _r_bandwidth = r"(?P<Bandwidth>{num}\s+\w+/sec)".format(num=_r_num)
+    _r_jitter = r"(?P<Jitter>\d+\.\d+\s(?:ms|us))"
+    _r_datagrams = r"(?P<Lost_vs_Total_Datagrams>\d+/\s*\d+)\s*\((?P<Lost_Datagrams_ratio>{num}\%)\)".format(num=_r_num)
     _r_rec = r"{}\s+{}\s+{}\s+{}".format(_r_id, _r_interval, _r_transfer, _r_bandwidth)
-    _r_rec_udp_svr = r"{}\s+{}\s+{}".format(_r_rec, _r_jitter, _r_datagrams)
-    _re_iperf_record = re.compile(_r_rec)
-    _re_iperf_record_udp_svr = re.compile(_r_rec_udp_svr)
+    _r_rec_udp_tail = r"\s+{}\s+{}".format(_r_jitter, _r_datagrams)
+    # udp-server form is strict superset of tcp/client one, so single regex
+    # with optional jitter/datagrams tail matches both in one scan per line
+    _re_iperf_record = re.compile(r"{}(?:{})?".format(_r_rec, _r_rec_udp_tail))
 
     def _parse_connection_info(self, line):
-        regex_found = self._regex_helper.search_compiled
-        if regex_found(Iperf2._re_iperf_record_udp_svr, line) or regex_found(Iperf2._re_iperf_record, line):
-            iperf_record = self._regex_helper.groupdict()
+        if ('sec' not in line) or ('[' not in line):  # every iperf record line has both
+            return
+        found = self._match_record(line)
+        if found:
+            iperf_record = {key: val for (key, val) in found.groupdict().items() if val is not None}
             connection_id = iperf_record.pop("ID")
-            iperf_record = self._detailed_parse_interval(iperf_record)
+            iperf_record["Interval"] = (float(iperf_record.pop("Interval_start")),
+                                        float(iperf_record.pop("Interval_end")))
             iperf_record = self._detailed_parse_datagrams(iperf_record)
             # [SUM]  0.0- 4.0 sec  1057980 KBytes  2165942 Kbits/sec   last line when server used with -P
             if (not self.parallel_client) and (connection_id == '[SUM]'):
-                raise ParsingDone  # skip it
+                return True  # skip it
             connection_name = self._connection_dict[connection_id]
             normalized_iperf_record = self._normalize_to_bytes(iperf_record)
             self._update_current_ret(connection_name, normalized_iperf_record)
@@ -344,13 +419,8 @@ class Iperf2(GenericUnixCommand, Publisher):
             self._parse_final_record(connection_name)
             if self.protocol == 'udp' and self._got_server_report_hdr:
                 self._got_server_report = True
-            raise ParsingDone
-
-    @staticmethod
-    def _detailed_parse_interval(iperf_record):
-        start, end = iperf_record["Interval"].split('-')
-        iperf_record["Interval"] = (float(start), float(end))
-        return iperf_record
+            return True
+        return False
 
     @staticmethod
     def _detailed_parse_datagrams(iperf_record):
@@ -360,29 +430,25 @@ class Iperf2(GenericUnixCommand, Publisher):
         return iperf_record
 
     def _update_current_ret(self, connection_name, info_dict):
-        if connection_name in self.current_ret['CONNECTIONS']:
-            self.current_ret['CONNECTIONS'][connection_name].append(info_dict)
-        else:
-            connection_dict = {connection_name: [info_dict]}
-            self.current_ret['CONNECTIONS'].update(connection_dict)
+        self._connections.setdefault(connection_name, []).append(info_dict)
 
     def _all_multiport_records_of_interval(self, connection_name):
         client, server = connection_name
         client_port, client_host = client.split("@")
-        last_interval = self.current_ret['CONNECTIONS'][connection_name][-1]['Interval']
+        last_interval = self._connections[connection_name][-1]['Interval']
         for conn_name in self._same_host_connections[client_host]:
-            if conn_name not in self.current_ret['CONNECTIONS']:
+            if conn_name not in self._connections:
                 return False
             if not self._get_last_record_of_interval(conn_name, last_interval):
                 return False
         return True
 
     def _get_last_record_of_interval(self, connection_name, interval):
-        last_rec = self.current_ret['CONNECTIONS'][connection_name][-1]
+        last_rec = self._connections[connection_name][-1]
         if last_rec['Interval'] == interval:
             return last_rec
-        if len(self.current_ret['CONNECTIONS'][connection_name]) > 1:
-            pre_last_rec = self.current_ret['CONNECTIONS'][connection_name][-2]
+        if len(self._connections[connection_name]) > 1:
+            pre_last_rec = self._connections[connection_name][-2]
             if pre_last_rec['Interval'] == interval:
                 return pre_last_rec
         return None
@@ -403,7 +469,7 @@ class Iperf2(GenericUnixCommand, Publisher):
         client_port, client_host = client.split("@")
         connections = self._same_host_connections[client_host]
 
-        interval = self.current_ret['CONNECTIONS'][connection_name][-1]['Interval']
+        interval = self._connections[connection_name][-1]['Interval']
         if interval == (4.0, 5.0):
             pass
         transfers = [self._get_last_record_of_interval(conn, interval)['Transfer'] for conn in connections]
@@ -446,12 +512,13 @@ class Iperf2(GenericUnixCommand, Publisher):
     def _parse_final_record(self, connection_name):
         if self.parallel_client and ('multiport' not in connection_name[0]):
             return  # for parallel we take report / publish stats only from summary records
-        last_record = self.current_ret['CONNECTIONS'][connection_name][-1]
+        last_record = self._connections[connection_name][-1]
         if self._is_final_record(last_record):
-            client_host, client_port, server_host, server_port = self._split_connection_name(connection_name)
-            from_client, to_server = client_host, "{}@{}".format(server_port, server_host)
+            # server half of connection name is already 'port@host' - reuse it as is
+            from_client = connection_name[0].split("@", 1)[1]  # client host without port
+            to_server = connection_name[1]
             result_connection = (from_client, to_server)
-            self.current_ret['CONNECTIONS'][result_connection] = {'report': last_record}
+            self._connections[result_connection] = {'report': last_record}
             self.notify_subscribers(from_client=from_client, to_server=to_server, report=last_record)
         else:
             from_client, to_server = connection_name
@@ -468,7 +535,7 @@ class Iperf2(GenericUnixCommand, Publisher):
     def _has_all_reports(self):
         if len(self._connection_dict) < 1:
             return False
-        result = self.current_ret['CONNECTIONS']
+        result = self._connections
         connections = list(self._connection_dict.values())
         client_host, client_port, server_host, server_port = self._split_connection_name(connections[0])
         from_client, to_server = client_host, "{}@{}".format(self.port, server_host)
@@ -486,32 +553,60 @@ class Iperf2(GenericUnixCommand, Publisher):
             all_reports = all_reports and self._got_server_report
         return all_reports
 
-    # [  5] Sent 2552 datagrams
+    # ornaments are dash separator lines and column headers like '[ ID] ...'
+    # (but not '[  5] Sent 2552 datagrams' which is still INFO)
     # ------------------------------------------------------------
-    _re_ornaments = re.compile(r"(?P<ORNAMENTS>----*|\[\s*ID\].*)", re.IGNORECASE)
-
     def _parse_connection_headers(self, line):
-        if not self._regex_helper.search_compiled(Iperf2._re_ornaments, line):
+        if ('---' not in line) and ('[ ID]' not in line) and ('[ID]' not in line):
             self.current_ret['INFO'].append(line.strip())
-            raise ParsingDone
+            return True
+        return False
 
     def _parse_svr_report_header(self, line):
         if "Server Report:" in line:
             self._got_server_report_hdr = True
-            raise ParsingDone
+            return True
+        return False
+
+    # iperf units form a small fixed set so direct multiplier lookup replaces
+    # generic (regex based) ConverterHelper.to_bytes parsing
+    _unit_to_bytes = {
+        "Bytes": 1,
+        "KBytes": 1024,  # iperf MBytes means 1024 * 1024 Bytes - see iperf.fr/iperf-doc.php
+        "MBytes": 1024 * 1024,
+        "GBytes": 1024 * 1024 * 1024,
+        "TBytes": 1024 * 1024 * 1024 * 1024,
+    }
+    _unit_to_bits = {
+        "bits": 1,
+        "Kbits": 1000,  # iperf Mbits means 1000 * 1000 bits - see iperf.fr/iperf-doc.php
+        "Mbits": 1000 * 1000,
+        "Gbits": 1000 * 1000 * 1000,
+        "Tbits": 1000 * 1000 * 1000 * 1000,
+    }
+    # precomputed '<key> Raw' names; building them with + would allocate
+    # a fresh string per normalized field of every record
+    _raw_key = {
+        "Transfer": "Transfer Raw",
+        "Bandwidth": "Bandwidth Raw",
+    }
 
     def _normalize_to_bytes(self, input_dict):
         new_dict = {}
         for (key, raw_value) in input_dict.items():
-            if 'Bytes' in raw_value:  # iperf MBytes means 1024 * 1024 Bytes - see iperf.fr/iperf-doc.php
-                new_dict[key + " Raw"] = raw_value
-                value_in_bytes, _, _ = self._converter_helper.to_bytes(raw_value)
-                new_dict[key] = value_in_bytes
-            elif 'bits' in raw_value:  # iperf Mbits means 1000 * 1000 bits - see iperf.fr/iperf-doc.php
-                new_dict[key + " Raw"] = raw_value
-                value_in_bits, _, _ = self._converter_helper.to_bytes(raw_value, binary_multipliers=False)
-                value_in_bytes = value_in_bits // 8
-                new_dict[key] = value_in_bytes
+            if 'Bytes' in raw_value:
+                new_dict[Iperf2._raw_key.get(key) or (key + " Raw")] = raw_value
+                value, unit = raw_value.split()
+                if unit.endswith("/sec"):
+                    unit = unit[:-4]
+                new_dict[key] = int(float(value) * Iperf2._unit_to_bytes[unit])
+            elif 'bits' in raw_value:
+                new_dict[Iperf2._raw_key.get(key) or (key + " Raw")] = raw_value
+                value, unit = raw_value.split()
+                if unit.endswith("/sec"):
+                    unit = unit[:-4]
+                value_in_bits = int(float(value) * Iperf2._unit_to_bits[unit])
+                new_dict[key] = value_in_bits // 8
             else:
                 new_dict[key] = raw_value
         return new_dict
@@ -521,9 +616,10 @@ class Iperf2(GenericUnixCommand, Publisher):
 
     def _parse_too_early_ctrl_c(self, line):
         # Happens at script execution. Scripts are quicker then humans.
-        if self._regex_helper.search_compiled(Iperf2._re_interrupt_again, line):
+        if self._search_interrupt(line):
             self.break_cmd()  # send Ctrl-C once more
-            raise ParsingDone
+            return True
+        return False
 
 
 COMMAND_OUTPUT_basic_client = """
@@ -5,9 +5,9 @@ Moler related configuration
 __author__ = 'Grzegorz Latuszek, Marcin Usielski, Michal Ernst, Tomasz Krol'
 __copyright__ = 'Copyright (C) 2018-2020, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com, marcin.usielski@nokia.com, michal.ernst@nokia.com, tomasz.krol@nokia.com'
+import copy
+import json
 import os
-import six
-import yaml
 from contextlib import contextmanager
 
 from moler.helpers import compare_objects
@@ -19,6 +19,23 @@ from . import loggers as log_cfg
 
 loaded_config = ["NOT_LOADED_YET"]
 
+# parsed YAML configs keyed by (path, mtime, size) - test suites reload
+# the very same file for every device so reparsing it each time is waste
+_yaml_cache = {}
+
+_yaml_loader = None  # resolved on first YAML read; keeps PyYAML out of import time
+
+
+def _get_yaml_loader():
+    global _yaml_loader
+    if _yaml_loader is None:
+        import yaml
+        try:  # LibYAML-based loader parses in C, roughly 10x faster than pure Python one
+            _yaml_loader = yaml.CSafeLoader
+        except AttributeError:
+            _yaml_loader = yaml.FullLoader
+    return _yaml_loader
+
 
 @contextmanager
 def read_configfile(path):
@@ -42,13 +59,35 @@ def read_yaml_configfile(path):
     :return: configuration as a python dictionary
     """
     if os.path.isabs(path):
-        with read_configfile(path) as content:
-            return yaml.load(content, Loader=yaml.FullLoader)
+        file_stat = os.stat(path)
+        cache_key = (path, file_stat.st_mtime_ns, file_stat.st_size)
+        if cache_key in _yaml_cache:
+            # deep copy since callers may modify returned configuration
+            return copy.deepcopy(_yaml_cache[cache_key])
+        import yaml  # deferred - PyYAML is needed only for file-based configs
+        # yaml reads straight from the stream - no whole-file string in between
+        with open(path, 'rb') as config_file:
+            config = yaml.load(config_file, Loader=_get_yaml_loader())
+        _yaml_cache[cache_key] = copy.deepcopy(config)
+        return config
     else:
         error = "Loading configuration requires absolute path and not '{}'".format(path)
         raise MolerException(error)
 
 
+# canonical forms of configs_are_same()'s last seen config list; lets repeated
+# loads of an already known config skip the deep comparison walk; the list is
+# held by reference (not id) so a freed list's recycled id cannot alias it
+_canonical_configs = {"list": None, "length": 0, "reprs": frozenset()}
+
+
+def _canonical_config(config):
+    try:
+        return json.dumps(config, sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+
+
 def configs_are_same(config_list, config_to_find):
     """
     Utility function to check if two configs are identical (deep comparison)
@@ -57,6 +96,15 @@ def configs_are_same(config_list, config_to_find):
     :param config_to_find: second config to compare
     :return: bool, True if config_to_find is in config_list, False otherwise.
     """
+    canonical = _canonical_config(config_to_find)
+    if canonical is not None:
+        if (_canonical_configs["list"] is not config_list) or (_canonical_configs["length"] != len(config_list)):
+            known = (_canonical_config(config) for config in config_list)
+            _canonical_configs["reprs"] = frozenset(cfg for cfg in known if cfg is not None)
+            _canonical_configs["list"] = config_list
+            _canonical_configs["length"] = len(config_list)
+        if canonical in _canonical_configs["reprs"]:
+            return True  # exact (canonical) match - no need for deep comparison
     for config in config_list:
         diff = compare_objects(config, config_to_find)
         if not diff:
@@ -74,6 +122,8 @@ def load_config(config=None, from_env_var=None, *args, **kwargs):
     :param from_env_var: name of environment variable storing config filename (file is in YAML format)
     :return: None
     """
+    import six  # deferred - needed only when configuration gets loaded
+
     global loaded_config
     add_devices_only = False
     from moler.device import DeviceFactory
@@ -130,52 +180,54 @@ def _load_topology(topology):
     """
     if topology:
         from moler.device import DeviceFactory
+        devices_by_name = {}  # devices show up many times as neighbours - look each up just once
+
+        def _get_device(name):
+            device = devices_by_name.get(name)
+            if device is None:
+                device = DeviceFactory.get_device(name=name, establish_connection=False)
+                devices_by_name[name] = device
+            return device
+
         for device_name in topology:
-            device = DeviceFactory.get_device(name=device_name, establish_connection=False)
+            device = _get_device(device_name)
             for neighbour_device_name in topology[device_name]:
-                neighbour_device = DeviceFactory.get_device(name=neighbour_device_name, establish_connection=False)
+                neighbour_device = _get_device(neighbour_device_name)
                 device.add_neighbour_device(neighbour_device=neighbour_device, bidirectional=True)
 
 
 def load_device_from_config(config, add_only=False):
-    create_at_startup = False
-    topology = None
     cloned_devices = dict()
     cloned_id = 'CLONED_FROM'
     from moler.device.device import DeviceFactory
 
-    if 'DEVICES' in config:
-        if 'DEFAULT_CONNECTION' in config['DEVICES']:
-            default_conn = config['DEVICES'].pop('DEFAULT_CONNECTION')
-            if add_only is False:
-                conn_desc = default_conn['CONNECTION_DESC']
-                dev_cfg.set_default_connection(**conn_desc)
-
-        if 'CREATE_AT_STARTUP' in config['DEVICES']:
-            create_at_startup = config['DEVICES'].pop('CREATE_AT_STARTUP')
-
-        topology = config['DEVICES'].pop('LOGICAL_TOPOLOGY', None)
-
-        for device_name in config['DEVICES']:
-            device_def = config['DEVICES'][device_name]
-
-            # check if device name is already used
-            if not _is_device_creation_needed(device_name, device_def):
-                continue
-            if cloned_id in device_def:
-                cloned_devices[device_name] = dict()
-                cloned_devices[device_name]['source'] = device_def[cloned_id]
-                cloned_devices[device_name]['state'] = device_def.get('INITIAL_STATE', None)
-                cloned_devices[device_name]['lazy_cmds_events'] = device_def.get('LAZY_CMDS_EVENTS', False)
-            else:  # create all devices defined directly
-                dev_cfg.define_device(
-                    name=device_name,
-                    device_class=device_def['DEVICE_CLASS'],
-                    connection_desc=device_def.get('CONNECTION_DESC', dev_cfg.default_connection),
-                    connection_hops={'CONNECTION_HOPS': device_def.get('CONNECTION_HOPS', {})},
-                    initial_state=device_def.get('INITIAL_STATE', None),
-                    lazy_cmds_events=device_def.get('LAZY_CMDS_EVENTS', False)
-                )
+    devices = config.get('DEVICES', {})
+    # take out the special keys once, then walk just real device definitions
+    default_conn = devices.pop('DEFAULT_CONNECTION', None)
+    if (default_conn is not None) and (add_only is False):
+        conn_desc = default_conn['CONNECTION_DESC']
+        dev_cfg.set_default_connection(**conn_desc)
+    create_at_startup = devices.pop('CREATE_AT_STARTUP', False)
+    topology = devices.pop('LOGICAL_TOPOLOGY', None)
+
+    for device_name, device_def in devices.items():
+        # check if device name is already used
+        if not _is_device_creation_needed(device_name, device_def):
+            continue
+        if cloned_id in device_def:
+            cloned_devices[device_name] = dict()
+            cloned_devices[device_name]['source'] = device_def[cloned_id]
+            cloned_devices[device_name]['state'] = device_def.get('INITIAL_STATE', None)
+            cloned_devices[device_name]['lazy_cmds_events'] = device_def.get('LAZY_CMDS_EVENTS', False)
+        else:  # create all devices defined directly
+            dev_cfg.define_device(
+                name=device_name,
+                device_class=device_def['DEVICE_CLASS'],
+                connection_desc=device_def.get('CONNECTION_DESC', dev_cfg.default_connection),
+                connection_hops={'CONNECTION_HOPS': device_def.get('CONNECTION_HOPS', {})},
+                initial_state=device_def.get('INITIAL_STATE', None),
+                lazy_cmds_events=device_def.get('LAZY_CMDS_EVENTS', False)
+            )
 
     for device_name, device_desc in cloned_devices.items():
         cloned_from = device_desc['source']
@@ -197,8 +249,9 @@ def _is_device_creation_needed(name, requested_device_def):
     :
     """
     from moler.device.device import DeviceFactory
+    if not DeviceFactory.has_device(name):
+        return True  # no exception-based probing for the common 'not created yet' case
     try:
-        DeviceFactory.get_device(name, establish_connection=False)
         msg = DeviceFactory.differences_between_devices_descriptions(name, requested_device_def)
         if msg:
             raise WrongUsage(msg)
@@ -207,19 +260,31 @@ def _is_device_creation_needed(name, requested_device_def):
         return True
 
 
+def _activate_raw_logs(active):
+    if active is True:
+        log_cfg.raw_logs_active = True
+
+
+def _configure_debug_level(level):
+    log_cfg.configure_debug_level(level=level)
+
+
+# handlers applied in this order when given key is present in LOGGER section
+_logger_config_handlers = {
+    'MODE': log_cfg.set_write_mode,
+    'PATH': log_cfg.set_logging_path,
+    'RAW_LOG': _activate_raw_logs,
+    'DEBUG_LEVEL': _configure_debug_level,
+    'DATE_FORMAT': log_cfg.set_date_format,
+}
+
+
 def load_logger_from_config(config):
-    if 'LOGGER' in config:
-        if 'MODE' in config['LOGGER']:
-            log_cfg.set_write_mode(config['LOGGER']['MODE'])
-        if 'PATH' in config['LOGGER']:
-            log_cfg.set_logging_path(config['LOGGER']['PATH'])
-        if 'RAW_LOG' in config['LOGGER']:
-            if config['LOGGER']['RAW_LOG'] is True:
-                log_cfg.raw_logs_active = True
-        if 'DEBUG_LEVEL' in config['LOGGER']:
-            log_cfg.configure_debug_level(level=config['LOGGER']['DEBUG_LEVEL'])
-        if 'DATE_FORMAT' in config['LOGGER']:
-            log_cfg.set_date_format(config['LOGGER']['DATE_FORMAT'])
+    logger_config = config.get('LOGGER')
+    if logger_config:
+        for key, handler in _logger_config_handlers.items():
+            if key in logger_config:
+                handler(logger_config[key])
 
     log_cfg.configure_moler_main_logger()
 
@@ -237,5 +302,9 @@ def clear():
     """Cleanup Moler's configuration"""
     global loaded_config
     loaded_config = ["NOT_LOADED_YET"]
+    _yaml_cache.clear()
+    _canonical_configs["list"] = None
+    _canonical_configs["length"] = 0
+    _canonical_configs["reprs"] = frozenset()
     conn_cfg.clear()
     dev_cfg.clear()
@@ -41,6 +41,20 @@ class DeviceFactory(object):
         """
         return cls._was_any_device_deleted
 
+    @classmethod
+    def has_device(cls, name):
+        """
+        Checks if device of given name was already created or is defined in configuration.
+
+        Unlike get_device it neither creates the device nor raises KeyError for unknown name.
+
+        :param name: name of device.
+        :return: True if device is known, False otherwise.
+        """
+        if cls._get_unique_name(name) in cls._devices:
+            return True
+        return name in devices_config.named_devices
+
     @classmethod
     def create_all_devices(cls):
         """
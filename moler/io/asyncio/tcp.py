@@ -16,6 +16,7 @@ __copyright__ = 'Copyright (C) 2018, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
 import asyncio
+import socket
 
 from moler.asyncio_runner import get_asyncio_loop_thread
 from moler.io.io_connection import IOConnection
@@ -44,7 +45,7 @@ class AsyncioTcp(IOConnection):
             data = await self._stream_reader.read(self.receive_buffer_size)  # if size not provided it reads till EOF (may block)
             if not data:
                 break
-            self._debug('< {}'.format(data))
+            self._debug('< %r', data)
             # forward data to moler-connection
             self.data_received(data, datetime.datetime.now())
         self.connection_lost.set_result(True)  # makes Future done
@@ -63,6 +64,13 @@ class AsyncioTcp(IOConnection):
             # TODO: stop child task of asyncio.open_connection
             raise
         else:
+            transport = self._stream_writer.transport
+            sock = transport.get_extra_info('socket')
+            if sock is not None:
+                # commands/prompts are small one-line writes; disable Nagle coalescing
+                # so they are not delayed waiting for more outgoing data
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            transport.set_write_buffer_limits(high=0)  # make drain() give true backpressure
             self.connection_lost = asyncio.Future()  # delayed to be created in same loop as open()
             asyncio.ensure_future(self.forward_connection_read_data())
         self._debug('connection {} is open'.format(self))
@@ -93,7 +101,7 @@ class AsyncioTcp(IOConnection):
         return False  # reraise exceptions if any
 
     def _send(self, data):
-        self._debug('> {}'.format(data))
+        self._debug('> %r', data)
         self._stream_writer.write(data)  # TODO: check if we have writer (if open)
 
     async def send(self, data):
@@ -110,9 +118,9 @@ class AsyncioTcp(IOConnection):
         address = 'tcp://{}:{}'.format(self.host, self.port)
         return address
 
-    def _debug(self, msg):  # TODO: refactor to class decorator or so
+    def _debug(self, msg, *args):  # TODO: refactor to class decorator or so
         if self.logger:
-            self.logger.debug(msg)
+            self.logger.debug(msg, *args)
 
 
 class AsyncioInThreadTcp(IOConnection):
@@ -54,6 +54,9 @@ class Tcp(object):
         self.receive_buffer_size = receive_buffer_size
         self.logger = logger  # TODO: build default logger if given is None?
         self.socket = None
+        # reusable receive buffer; recv_into() fills it in-place so we don't
+        # allocate receive_buffer_size bytes on every read (recv() does)
+        self._recv_buffer = bytearray(receive_buffer_size)
 
     def open(self):
         """
@@ -66,6 +69,9 @@ class Tcp(object):
         if sys.platform.startswith('java'):  # Program runs under Jython
             blocking = 0  # Jython  limitation
         self.socket.setblocking(blocking)
+        # commands/prompts are small one-line writes; disable Nagle coalescing
+        # so they are not delayed waiting for more outgoing data
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._debug('connecting to {}'.format(self))
         self.socket.connect((self.host, self.port))
         self._debug('connection {} is open'.format(self))
@@ -101,7 +107,10 @@ class Tcp(object):
         :type data: str
         """
         try:
-            self.socket.send(data)
+            # sendall() loops over partial sends inside C code; plain send()
+            # could silently drop the tail of data and would need a Python-level
+            # retry loop with per-iteration slicing
+            self.socket.sendall(data)
         except socket.error as serr:
             if (serr.errno == 10054) or (serr.errno == 10053):
                 self._close_ignoring_exceptions()
@@ -122,7 +131,7 @@ class Tcp(object):
         ready = select.select([self.socket], [], [], timeout)
         if ready[0]:
             try:
-                data = self.socket.recv(self.receive_buffer_size)
+                nb_received = self.socket.recv_into(self._recv_buffer)
             except socket.error as serr:
                 if (serr.errno == 10054) or (serr.errno == 10053):
                     self._close_ignoring_exceptions()
@@ -130,10 +139,10 @@ class Tcp(object):
                 else:
                     raise serr
 
-            if not data:
+            if not nb_received:
                 self._close_ignoring_exceptions()
                 raise RemoteEndpointDisconnected()
-            return data
+            return bytes(memoryview(self._recv_buffer)[:nb_received])
 
         else:
             # don't want to show class name - just tcp address
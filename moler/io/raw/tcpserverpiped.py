@@ -200,6 +200,53 @@ class TcpServerPiped(Process):
             err = 'data for "inject response" must contain "req" and "resp" keys - not %s' % kwargs
             self.history.append(err)
 
+    def do_reset_history(self, **kwargs):
+        """
+        Handles following pipe message
+        ("reset history", {})
+        Clear server's history (lets tests share one server
+        while still asserting on per-test activity)
+        """
+        self.history = []
+
+    def do_wait_for_event(self, **kwargs):
+        """
+        Handles following pipe message
+        ("wait for event", {'event': 'disconnected'})
+        Await given event to show up in server's history
+        and acknowledge it back via pipe.
+        Lets client-side synchronize with server activity
+        instead of blindly sleeping.
+        """
+        if 'event' not in kwargs:
+            err = 'data for "wait for event" must contain "event" key - not %s' % kwargs
+            self.history.append(err)
+            return
+        event = kwargs['event']
+        timeout = kwargs.get('timeout', 5.0)
+        awaited_entry = {'connected': 'Client connected',
+                         'disconnected': 'Client disconnected',
+                         'data received': 'Received data:'}.get(event, event)
+
+        def event_occured():
+            for entry in self.history:
+                if entry == awaited_entry:
+                    return True
+                if isinstance(entry, list) and entry[0] == awaited_entry:
+                    return True
+            return False
+
+        start_time = time.time()
+        while self.server_is_running and not event_occured():
+            if time.time() - start_time > timeout:
+                self.history.append('Timeout of "wait for event": "{}"'.format(event))
+                break
+            if self.client_sock is None:  # no client connected yet
+                self.check_and_handle_server_socket()
+            else:
+                self.check_and_handle_client_socket()
+        self.pipe_in.send(("event occured", {'event': event}))
+
     def do_get_history(self, **kwargs):
         """
         Handles following pipe message
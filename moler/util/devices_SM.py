@@ -9,6 +9,7 @@ __email__ = 'michal.ernst@nokia.com'
 
 import os
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 from moler.device import DeviceFactory
 from moler.device.textualdevice import TextualDevice
@@ -17,26 +18,58 @@ from moler.config import load_config
 from moler.helpers import copy_list
 
 
-def iterate_over_device_states(device):
+def iterate_over_device_states(device, device_factory=None, max_workers=None):
+    """
+    Check all source-state/target-state transitions of given device.
+
+    :param device: device to exercise; with default arguments transitions run sequentially on it.
+    :param device_factory: optional no-arg callable returning an independent device copy;
+     when given, per-source-state walks run in parallel, each on its own device.
+    :param max_workers: thread count limit for the parallel walks.
+    :return: None
+    """
     source_states = _get_all_states_from_device(device=device)
     target_states = copy_list(source_states)
 
     random.shuffle(source_states)
     random.shuffle(target_states)
 
-    for source_state in source_states:
+    def _walk_from_source(walked_device, source_state):
         for target_state in target_states:
             try:
-                device.goto_state(source_state)
-                device.goto_state(target_state)
+                walked_device.goto_state(source_state)
+                walked_device.goto_state(target_state)
             except Exception as exc:
                 raise MolerException(
                     "Cannot trigger change state: '{}' -> '{}'\n{}".format(source_state, target_state, exc))
 
+    if device_factory is None:
+        for source_state in source_states:
+            _walk_from_source(device, source_state)
+    else:
+        workers = max_workers if max_workers else min(8, len(source_states))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            walks = [pool.submit(_walk_from_source, device_factory(), source_state)
+                     for source_state in source_states]
+            for walk in walks:
+                walk.result()
+
+
+_device_config_path_cache = {}  # resolved device_config.yml location per calling test file
+
+
+def _device_config_path(test_file_path):
+    config_path = _device_config_path_cache.get(test_file_path)
+    if config_path is None:
+        dir_path = os.path.dirname(os.path.realpath(test_file_path))
+        config_path = os.path.normpath(os.path.join(dir_path, os.pardir, os.pardir,
+                                                    'test', 'resources', 'device_config.yml'))
+        _device_config_path_cache[test_file_path] = config_path
+    return config_path
+
 
 def get_device(name, connection, device_output, test_file_path):
-    dir_path = os.path.dirname(os.path.realpath(test_file_path))
-    load_config(os.path.join(dir_path, os.pardir, os.pardir, 'test', 'resources', 'device_config.yml'))
+    load_config(_device_config_path(test_file_path))
 
     device = DeviceFactory.get_device(name)
     device.io_connection = connection
@@ -19,6 +19,8 @@ from moler.connection_observer import ConnectionObserver
 from moler.exceptions import MolerException
 from moler.exceptions import ExecutionException
 
+_FUNC_TYPES = (FunctionType, MethodType)  # built once - not per inspected attribute
+
 
 class MolerTest(object):
 
@@ -145,15 +147,16 @@ class MolerTest(object):
         err_msg = ""
 
         unraised_exceptions = ConnectionObserver.get_unraised_exceptions(True)
-        occured_exceptions = list()
-        for unraised_exception in unraised_exceptions:
-            occured_exceptions.append(unraised_exception)
+        occured_exceptions = list(unraised_exceptions)
         if caught_exception:
             occured_exceptions.append(caught_exception)
 
+        if not was_error_in_last_execution and not occured_exceptions and not MolerTest._list_of_errors:
+            return err_msg  # the usual case - test went clean, nothing to build
+
         if was_error_in_last_execution:
             err_msg += "Moler caught some error messages during execution. Please check Moler logs for details.\n"
-        if len(occured_exceptions) > 0:
+        if occured_exceptions:
             err_msg += "There were unhandled exceptions from test caught by Moler.\n"
             for i, exc in enumerate(occured_exceptions, 1):
                 try:
@@ -163,7 +166,7 @@ class MolerTest(object):
                 except AttributeError:
                     err_msg += repr(exc)
 
-        if len(MolerTest._list_of_errors) > 0:
+        if MolerTest._list_of_errors:
             err_msg += "Moler caught some error messages during execution:\n"
 
             for i, msg in enumerate(MolerTest._list_of_errors, 1):
@@ -197,15 +200,15 @@ class MolerTest(object):
                                      )
 
         if hasattr(obj, "__dict__"):
-            if obj.__dict__.items():
+            if obj.__dict__:
                 for attributeName in dir(obj):
                     if attributeName == "_already_decorated":
                         break
 
                     attribute = getattr(obj, attributeName)
 
-                    if not attributeName.startswith("_"):
-                        if isinstance(attribute, (FunctionType, MethodType)):
+                    if attributeName[:1] != "_":  # slice compare - no method lookup per attribute
+                        if isinstance(attribute, _FUNC_TYPES):
                             setattr(obj, attributeName, MolerTest._wrapper(attribute, check_steps_end=check_steps_end))
             else:
                 obj = MolerTest._wrapper(obj, check_steps_end=check_steps_end)
@@ -216,7 +219,7 @@ class MolerTest(object):
 
     @staticmethod
     def _wrapper(method, check_steps_end):
-        if hasattr(method, '_already_decorated') and method._already_decorated:
+        if getattr(method, '_already_decorated', False):
             return method
 
         @wraps(method)
@@ -534,6 +534,25 @@ def test_iperf_publishes_only_summary_records_when_handling_parallel_clients(buf
     assert iperf_stats[summary_conn_name] == expected_result['CONNECTIONS'][summary_conn_name][:-1]
 
 
+def test_iperf_parse_buffer_replay_gives_same_result_as_live_parsing(buffer_connection):
+    from moler.cmd.unix import iperf2
+    iperf_cmd = iperf2.Iperf2(connection=buffer_connection.moler_connection,
+                              **iperf2.COMMAND_KWARGS_basic_client)
+    # replay what the command sees during live run: full lines between command echo and prompt
+    output_lines = iperf2.COMMAND_OUTPUT_basic_client.splitlines()[2:-1]
+    iperf_cmd.parse_buffer("\n".join(output_lines))
+    assert iperf_cmd.current_ret == iperf2.COMMAND_RESULT_basic_client
+
+
+def test_iperf_parse_buffer_replay_handles_multiconnection_udp_server_output(buffer_connection):
+    from moler.cmd.unix import iperf2
+    iperf_cmd = iperf2.Iperf2(connection=buffer_connection.moler_connection,
+                              **iperf2.COMMAND_KWARGS_multiple_connections_udp_server)
+    output_lines = iperf2.COMMAND_OUTPUT_multiple_connections_udp_server.splitlines()[2:-1]
+    iperf_cmd.parse_buffer("\n".join(output_lines))
+    assert iperf_cmd.current_ret == iperf2.COMMAND_RESULT_multiple_connections_udp_server
+
+
 @pytest.fixture
 def command_output_and_expected_result_on_bind_failed():
     output = """xyz@debian>iperf -s
@@ -10,7 +10,6 @@ __author__ = 'Grzegorz Latuszek'
 __copyright__ = 'Copyright (C) 2018, Nokia'
 __email__ = 'grzegorz.latuszek@nokia.com'
 
-import time
 import importlib
 import asyncio
 import pytest
@@ -31,7 +30,8 @@ async def test_can_open_and_close_connection(tcp_connection_class,
     connection = tcp_connection_class(moler_connection=moler_conn, port=tcp_server.port, host=tcp_server.host)
     await connection.open()
     await connection.close()
-    time.sleep(0.1)  # otherwise we have race between server's pipe and from-client-connection
+    tcp_server_pipe.send(("wait for event", {"event": "disconnected"}))
+    tcp_server_pipe.recv()  # deterministic sync with server instead of sleep-based race avoidance
     tcp_server_pipe.send(("get history", {}))
     dialog_with_server = tcp_server_pipe.recv()
     assert 'Client connected' in dialog_with_server
@@ -49,7 +49,8 @@ async def test_closing_closed_connection_does_nothing(tcp_connection_class,
     await connection.open()
     await connection.close()
     await connection.close()
-    time.sleep(0.1)  # otherwise we have race between server's pipe and from-client-connection
+    tcp_server_pipe.send(("wait for event", {"event": "disconnected"}))
+    tcp_server_pipe.recv()  # deterministic sync with server instead of sleep-based race avoidance
     tcp_server_pipe.send(("get history", {}))
     dialog_with_server = tcp_server_pipe.recv()
     assert 'Client connected' in dialog_with_server
@@ -67,7 +68,8 @@ async def test_can_open_and_close_connection_as_context_manager(tcp_connection_c
     connection = tcp_connection_class(moler_connection=moler_conn, port=tcp_server.port, host=tcp_server.host)
     async with connection:
         pass
-    time.sleep(0.1)  # otherwise we have race between server's pipe and from-client-connection
+    tcp_server_pipe.send(("wait for event", {"event": "disconnected"}))
+    tcp_server_pipe.recv()  # deterministic sync with server instead of sleep-based race avoidance
     tcp_server_pipe.send(("get history", {}))
     dialog_with_server = tcp_server_pipe.recv()
     assert 'Client connected' in dialog_with_server
@@ -87,7 +89,8 @@ async def test_can_send_binary_data_over_connection(tcp_connection_class,
     connection = tcp_connection_class(moler_connection=moler_conn, port=tcp_server.port, host=tcp_server.host)
     async with connection:
         moler_conn.send(data=b'data to be send')  # TODO: await moler_conn.send(data=b'data to be send') ???
-        time.sleep(0.1)  # otherwise we have race between server's pipe and from-client-connection
+        tcp_server_pipe.send(("wait for event", {"event": "data received"}))
+        tcp_server_pipe.recv()  # deterministic sync with server instead of sleep-based race avoidance
         tcp_server_pipe.send(("get history", {}))
         dialog_with_server = tcp_server_pipe.recv()
         assert ['Received data:', b'data to be send'] == dialog_with_server[-1]
@@ -116,7 +119,8 @@ async def test_can_receive_binary_data_from_connection(tcp_connection_class,
     moler_conn.subscribe(receiver)       # build forwarding path
     connection = tcp_connection_class(moler_connection=moler_conn, port=tcp_server.port, host=tcp_server.host)
     async with connection:  # TODO: async with connection.open():
-        time.sleep(0.1)  # otherwise we have race between server's pipe and from-client-connection
+        tcp_server_pipe.send(("wait for event", {"event": "connected"}))
+        tcp_server_pipe.recv()  # deterministic sync with server instead of sleep-based race avoidance
         tcp_server_pipe.send(("send async msg", {'msg': b'data to read'}))
         await asyncio.wait_for(receiver_called.wait(), timeout=0.5)
 
@@ -136,9 +140,17 @@ def tcp_connection_class(request):
     return connection_class
 
 
-@pytest.yield_fixture()
-def integration_tcp_server_and_pipe():
+@pytest.fixture(scope="module")
+def module_tcp_server_and_pipe():
     from moler.io.raw.tcpserverpiped import tcp_server_piped
     with tcp_server_piped(use_stderr_logger=True) as server_and_pipe:
         (server, svr_ctrl_pipe) = server_and_pipe
         yield (server, svr_ctrl_pipe)
+
+
+@pytest.fixture()
+def integration_tcp_server_and_pipe(module_tcp_server_and_pipe):
+    # server subprocess is spawned once per module; each test just gets fresh history
+    (server, svr_ctrl_pipe) = module_tcp_server_and_pipe
+    svr_ctrl_pipe.send(("reset history", {}))
+    yield (server, svr_ctrl_pipe)